@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file androguard_all.py
+# @brief Batched Androguard subcommand runner for the Deadbolt image.
+#
+# This script runs the Androguard subcommands used by Deadbolt (apkid, axml
+# and sign) against one APK inside a single container, concurrently, and
+# prints their combined output as one JSON object keyed by subcommand. It
+# saves the runner from starting one container per subcommand.
+#
+# Usage: python /opt/deadbolt/androguard_all.py /input.apk
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import json
+import subprocess
+import sys
+
+# Androguard subcommands whose outputs make up androguard.json
+SUBCOMMANDS = ("apkid", "axml", "sign")
+
+
+def main() -> int:
+    apk = sys.argv[1]
+
+    procs = {
+        command: subprocess.Popen(
+            ["androguard", command, apk],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for command in SUBCOMMANDS
+    }
+
+    data = {}
+    status = 0
+
+    for command, proc in procs.items():
+        out, err = proc.communicate()
+        if proc.returncode != 0:
+            sys.stderr.write(err)
+            status = status or proc.returncode
+        data[command] = out.strip()
+
+    if status:
+        return status
+
+    json.dump(data, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
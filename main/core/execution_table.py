@@ -1,234 +1,443 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file execution_table.py
-# @brief Live execution status table for Deadbolt scanning workflows.
-#
-# This module defines the ExecutionTable class, which renders a real-time,
-# terminal-based status dashboard using Rich. It tracks tool execution state,
-# durations, findings count, and update information while scans are running.
-#
-# The table is updated continuously from a background thread to provide a
-# responsive, non-blocking view of scan progress across multiple tools.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-import threading
-import time
-from datetime import datetime, timezone
-from typing import Dict, Optional
-
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.box import SIMPLE
-
-
-class ExecutionTable:
-    """
-    Live-rendered execution status table.
-
-    This class maintains state for multiple scanning tools and continuously
-    renders their execution progress, duration, version, update status, and
-    findings count to the terminal using Rich's Live display.
-    """
-
-    def __init__(self):
-        """
-        Initialize the execution table and its internal state.
-
-        Sets up synchronization primitives, tracking structures, and the
-        Rich Live renderer used to update the table in real time.
-        """
-        self._lock = threading.Lock()
-
-        self.console = Console()
-
-        # Per-tool execution timestamps
-        self.started_at: Dict[str, datetime] = {}
-        self.ended_at: Dict[str, datetime] = {}
-
-        # Per-tool execution state and results
-        self.status: Dict[str, str] = {}
-        self.findings: Dict[str, Optional[int]] = {}
-
-        # Version and update tracking
-        self.versions: Dict[str, str] = {}
-        self.latest_versions: Dict[str, Optional[str]] = {}
-        self.update_status: Dict[str, str] = {}
-
-        # Live rendering control
-        self._running = False
-        self._ticker = None
-
-        # Rich Live display instance
-        self.live = Live(
-            self._render(),
-            console=self.console,
-            refresh_per_second=60,
-        )
-
-    def start(self):
-        """
-        Start the live table rendering loop.
-
-        This enables the Rich Live display and launches a background thread
-        responsible for periodically refreshing the table contents.
-        """
-        self._running = True
-        self.live.start()
-
-        self._ticker = threading.Thread(
-            target=self._tick,
-            daemon=True,
-        )
-        self._ticker.start()
-
-    def stop(self):
-        """
-        Stop the live table rendering loop.
-
-        Performs a final refresh and cleanly stops the Rich Live display.
-        """
-        self._refresh()
-        self._running = False
-        self.live.stop()
-
-    def _refresh(self):
-        """
-        Refresh the rendered table.
-
-        This method is synchronized to prevent concurrent render updates
-        from multiple threads.
-        """
-        with self._lock:
-            self.live.update(self._render(), refresh=True)
-
-    def _tick(self):
-        """
-        Periodic refresh loop for live rendering.
-
-        Runs in a background thread and refreshes the table at a fixed
-        interval to keep durations and statuses up to date.
-        """
-        while self._running:
-            self._refresh()
-            time.sleep(0.05)  # 50ms refresh interval
-
-    def register_tool(self, tool: str, version: str):
-        """
-        Register a tool with the execution table.
-
-        Initializes tracking state for a tool before execution begins.
-        """
-        self.versions[tool] = version
-        self.status[tool] = "queued"
-        self.findings[tool] = None
-        self.latest_versions[tool] = None
-        self.update_status[tool] = "checking"
-
-    def tool_started(self, tool: str):
-        """
-        Mark a tool as started.
-
-        Records the start time and updates the execution status.
-        """
-        self.started_at[tool] = datetime.now(timezone.utc)
-        self.status[tool] = "running"
-        self._refresh()
-
-    def tool_finished(self, tool: str, findings: int):
-        """
-        Mark a tool as successfully completed.
-
-        Records the end time, final findings count, and updates status.
-        """
-        self.status[tool] = "done"
-        self.findings[tool] = findings
-        self.ended_at[tool] = datetime.now(timezone.utc)
-        self._refresh()
-
-    def tool_failed(self, tool: str):
-        """
-        Mark a tool execution as failed.
-
-        Records the failure state and end time.
-        """
-        self.status[tool] = "failed"
-        self.findings[tool] = 0
-        self.ended_at[tool] = datetime.now(timezone.utc)
-        self._refresh()
-
-    def tool_skipped(self, tool: str):
-        """
-        Mark a tool as skipped.
-
-        Used when a tool is intentionally not executed.
-        """
-        self.status[tool] = "skipped"
-        self.findings[tool] = None
-        self._refresh()
-
-    def _render(self) -> Table:
-        """
-        Render the execution status table.
-
-        Constructs and returns a Rich Table reflecting the current state
-        of all registered tools.
-        """
-        table = Table(
-            box=SIMPLE,
-            show_lines=False,
-            expand=False,
-            padding=(0, 3),
-        )
-
-        table.add_column("Tool", style="bold cyan", no_wrap=True)
-        table.add_column("Version", style="dim")
-        table.add_column("Update", justify="center", style="bold")
-        table.add_column("Status", justify="center")
-        table.add_column("Duration", justify="right", style="magenta")
-        table.add_column("Findings", justify="right", style="bold")
-
-        for tool in sorted(self.status.keys()):
-            # Compute execution duration
-            duration = "-"
-            if tool in self.started_at:
-                end = self.ended_at.get(tool)
-                delta = (end or datetime.now(timezone.utc)) - self.started_at[tool]
-                duration = f"{delta.total_seconds():.1f}s"
-
-            # Status formatting and coloring
-            raw_status = self.status[tool]
-
-            if raw_status == "queued":
-                status = "[dim]QUEUED[/dim]"
-            elif raw_status == "running":
-                status = "[yellow]RUNNING[/yellow]"
-            elif raw_status == "done":
-                status = "[green]DONE[/green]"
-            elif raw_status == "skipped":
-                status = "[dim]SKIPPED[/dim]"
-            else:
-                status = "[red]FAILED[/red]"
-
-            findings = (
-                str(self.findings[tool])
-                if self.findings[tool] is not None
-                else "—"
-            )
-
-            update = self.update_status.get(tool) or "—"
-
-            table.add_row(
-                tool,
-                self.versions.get(tool, "—"),
-                update,
-                status,
-                duration,
-                findings,
-            )
-
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file execution_table.py
+# @brief Live execution status table for Deadbolt scanning workflows.
+#
+# This module defines the ExecutionTable class, which renders a real-time,
+# terminal-based status dashboard using Rich. It tracks tool execution state,
+# durations, findings count, and update information while scans are running.
+#
+# The table is updated continuously from a background thread to provide a
+# responsive, non-blocking view of scan progress across multiple tools.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from rich.box import SIMPLE
+
+
+# Ticker wake-up interval while tools are running (durations keep moving)
+REFRESH_INTERVAL = 0.25
+
+# Upper bound on repaint rate; state changes inside one window coalesce
+MAX_REFRESH_HZ = 20
+
+# Rich markup for each tool status
+_STATUS_MARKUP = {
+    "queued": "[dim]QUEUED[/dim]",
+    "running": "[yellow]RUNNING[/yellow]",
+    "done": "[green]DONE[/green]",
+    "skipped": "[dim]SKIPPED[/dim]",
+    "failed": "[red]FAILED[/red]",
+}
+
+# Placeholders for missing values
+_DASH = "—"
+_HYPHEN = "-"
+
+# Process-wide Rich console, created on first use
+_SHARED_CONSOLE: Optional[Console] = None
+
+
+def _get_console() -> Console:
+    """
+    Return the shared Rich console, creating it on first use.
+
+    Console construction probes the terminal (TTY, size, color support);
+    sharing one instance avoids repeating that work per table.
+    """
+    global _SHARED_CONSOLE
+    if _SHARED_CONSOLE is None:
+        _SHARED_CONSOLE = Console()
+    return _SHARED_CONSOLE
+
+
+@dataclass(slots=True)
+class ToolRow:
+    """
+    Display and timing state for a single registered tool.
+    """
+
+    version: str
+    status: str = "queued"
+    findings: Optional[int] = None
+
+    # Display form of findings, formatted once per state transition
+    findings_str: str = _DASH
+
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+
+    # Monotonic clock readings used for duration display
+    started_mono: Optional[float] = None
+    ended_mono: Optional[float] = None
+
+    latest_version: Optional[str] = None
+    update_status: str = "checking"
+
+
+class ExecutionTable:
+    """
+    Live-rendered execution status table.
+
+    This class maintains state for multiple scanning tools and continuously
+    renders their execution progress, duration, version, update status, and
+    findings count to the terminal using Rich's Live display.
+    """
+
+    # Column schema shared by every rendered table
+    _COLUMN_SPEC = (
+        ("Tool", {"style": "bold cyan", "no_wrap": True}),
+        ("Version", {"style": "dim"}),
+        ("Update", {"justify": "center", "style": "bold"}),
+        ("Status", {"justify": "center"}),
+        ("Duration", {"justify": "right", "style": "magenta"}),
+        ("Findings", {"justify": "right", "style": "bold"}),
+    )
+
+    def __init__(self):
+        """
+        Initialize the execution table and its internal state.
+
+        Sets up synchronization primitives, tracking structures, and the
+        Rich Live renderer used to update the table in real time.
+
+        Row fields are shared without a lock: each is written with a single
+        attribute store, and a tool's status is written last so a
+        concurrent snapshot never sees a terminal status without its end
+        time. The state version is a read-modify-write shared by
+        concurrent tool threads, so it is advanced under a small lock that
+        rendering never takes.
+        """
+        self.console = _get_console()
+
+        # Per-tool execution state, timestamps, and version tracking
+        self._rows: Dict[str, ToolRow] = {}
+
+        # Registered tools in display order (maintained on registration)
+        self._sorted_tools: List[str] = []
+
+        # Render cache, invalidated whenever the state version advances
+        self._version_lock = threading.Lock()
+        self._state_version = 0
+        self._cached_version = -1
+        self._cached_table: Optional[Table] = None
+
+        # Live rendering control
+        self._running = False
+        self._ticker = None
+
+        # Set by state mutators; wakes the ticker for a redraw
+        self._dirty = threading.Event()
+
+        # Rich Live display instance; redraws are driven explicitly by the
+        # ticker, so Live's own refresh thread is disabled
+        self.live = Live(
+            self._render(),
+            console=self.console,
+            auto_refresh=False,
+        )
+
+    def start(self):
+        """
+        Start the live table rendering loop.
+
+        This enables the Rich Live display and launches a background thread
+        responsible for periodically refreshing the table contents.
+        Calling start() on a table that is already running is a no-op.
+        """
+        if self._running:
+            return
+
+        self._running = True
+        self.live.start()
+
+        self._ticker = threading.Thread(
+            target=self._tick,
+            daemon=True,
+        )
+        self._ticker.start()
+
+    def stop(self):
+        """
+        Stop the live table rendering loop.
+
+        Performs a final refresh and cleanly stops the Rich Live display.
+        """
+        self._running = False
+        self._dirty.set()
+        self._refresh()
+        self.live.stop()
+
+    def _refresh(self):
+        """
+        Refresh the rendered table.
+
+        Mutators never wait on rendering or terminal IO.
+        """
+        self.live.update(self._render(), refresh=True)
+
+    def _tick(self):
+        """
+        Periodic refresh loop for live rendering.
+
+        Runs in a background thread and redraws the table only when state
+        has changed or a running tool's duration needs to advance. While no
+        tool is running the ticker parks until the next state change.
+
+        Repaints are capped at MAX_REFRESH_HZ: a change arriving sooner
+        than that after the previous repaint waits out the rest of the
+        window, so a burst of updates (e.g. version threads resolving
+        together) collapses into a single redraw.
+        """
+        min_gap = 1.0 / MAX_REFRESH_HZ
+        last = 0.0
+
+        while self._running:
+            timeout = REFRESH_INTERVAL if self._any_running() else None
+            dirty = self._dirty.wait(timeout=timeout)
+
+            # Let further changes accumulate until the window has passed
+            remaining = min_gap - (time.monotonic() - last)
+            if remaining > 0:
+                time.sleep(remaining)
+
+            self._dirty.clear()
+
+            if not self._running:
+                break
+
+            if dirty or self._any_running():
+                self._refresh()
+                last = time.monotonic()
+
+    def _any_running(self) -> bool:
+        """
+        Return whether any registered tool is currently running.
+
+        Derived from the rows themselves rather than a shared counter, so
+        concurrent mutators cannot make it drift. A tool that starts after
+        this check also marks the table dirty, which wakes the ticker.
+        """
+        return any(
+            row.status == "running" for row in list(self._rows.values())
+        )
+
+    def _mark_dirty(self):
+        """
+        Signal the ticker that state changed and a redraw is due.
+        """
+        with self._version_lock:
+            self._state_version += 1
+        self._dirty.set()
+
+    def register_tool(self, tool: str, version: str):
+        """
+        Register a tool with the execution table.
+
+        Initializes tracking state for a tool before execution begins.
+        """
+        if tool not in self._rows:
+            bisect.insort(self._sorted_tools, tool)
+
+        self._rows[tool] = ToolRow(version=version)
+        self._mark_dirty()
+
+    def set_versions(
+        self,
+        tool: str,
+        installed: str,
+        latest: Optional[str],
+        update_status: str,
+    ):
+        """
+        Record resolved version information for a tool.
+
+        Called from version detection threads once installed and latest
+        versions are known.
+        """
+        row = self._rows[tool]
+        row.version = installed
+        row.latest_version = latest
+        row.update_status = update_status or _DASH
+        self._mark_dirty()
+
+    def get_version(self, tool: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Return the displayed installed version for a tool.
+        """
+        row = self._rows.get(tool)
+        return row.version if row else default
+
+    def tool_started(self, tool: str):
+        """
+        Mark a tool as started.
+
+        Records the start time and updates the execution status.
+        """
+        row = self._rows[tool]
+        row.started_at = datetime.now(timezone.utc)
+        row.started_mono = time.monotonic()
+        row.status = "running"
+        self._mark_dirty()
+
+    def tool_finished(self, tool: str, findings: int):
+        """
+        Mark a tool as successfully completed.
+
+        Records the end time, final findings count, and updates status.
+        """
+        row = self._rows[tool]
+        row.findings = findings
+        row.findings_str = str(findings)
+        row.ended_at = datetime.now(timezone.utc)
+        row.ended_mono = time.monotonic()
+        row.status = "done"
+        self._mark_dirty()
+
+    def tool_failed(self, tool: str):
+        """
+        Mark a tool execution as failed.
+
+        Records the failure state and end time.
+        """
+        row = self._rows[tool]
+        row.findings = 0
+        row.findings_str = "0"
+        row.ended_at = datetime.now(timezone.utc)
+        row.ended_mono = time.monotonic()
+        row.status = "failed"
+        self._mark_dirty()
+
+    def tool_skipped(self, tool: str):
+        """
+        Mark a tool as skipped.
+
+        Used when a tool is intentionally not executed.
+        """
+        row = self._rows[tool]
+        row.findings = None
+        row.findings_str = _DASH
+        row.status = "skipped"
+        self._mark_dirty()
+
+    def _snapshot(self) -> Tuple[int, List[tuple]]:
+        """
+        Capture the state version and per-tool display fields.
+
+        Each row's status is read first, so any end time written before a
+        terminal status is guaranteed to be visible in the same tuple.
+        """
+        rows = self._rows
+        return self._state_version, [
+            (
+                tool,
+                row.status,
+                row.version,
+                row.findings_str,
+                row.started_mono,
+                row.ended_mono,
+                row.update_status,
+            )
+            for tool in self._sorted_tools
+            for row in (rows[tool],)
+        ]
+
+    def _new_table(self) -> Table:
+        """
+        Create an empty status table with the standard column schema.
+        """
+        table = Table(
+            box=SIMPLE,
+            show_lines=False,
+            expand=False,
+            padding=(0, 3),
+        )
+
+        for header, options in self._COLUMN_SPEC:
+            table.add_column(header, **options)
+
+        return table
+
+    def _render(self) -> Table:
+        """
+        Render the execution status table.
+
+        Snapshots current state and builds the table from the snapshot.
+        """
+        version, snapshot = self._snapshot()
+        return self._render_from_snapshot(version, snapshot)
+
+    def _render_from_snapshot(
+        self,
+        version: int,
+        snapshot: List[tuple],
+    ) -> Table:
+        """
+        Build the execution status table from a state snapshot.
+
+        Constructs and returns a Rich Table reflecting the snapshotted state
+        of all registered tools. The previous table is reused when no state
+        changed and no running duration needs to advance.
+        """
+        if (
+            version == self._cached_version
+            and not any(entry[1] == "running" for entry in snapshot)
+        ):
+            return self._cached_table
+
+        table = self._new_table()
+
+        # Bind hot names locally for the row loop
+        add_row = table.add_row
+        status_lut = _STATUS_MARKUP
+        status_failed = status_lut["failed"]
+        dash = _DASH
+        hyphen = _HYPHEN
+
+        # Single monotonic clock read shared by all running rows
+        now = time.monotonic()
+
+        for (
+            tool,
+            raw_status,
+            tool_version,
+            findings,
+            started_mono,
+            ended_mono,
+            update_status,
+        ) in snapshot:
+            # Compute execution duration
+            duration = hyphen
+            if started_mono is not None:
+                elapsed = (ended_mono or now) - started_mono
+                tenths = int(elapsed * 10)
+                duration = f"{tenths // 10}.{tenths % 10}s"
+
+            # Status formatting and coloring
+            status = status_lut.get(raw_status, status_failed)
+
+            add_row(
+                tool,
+                tool_version or dash,
+                update_status,
+                status,
+                duration,
+                findings,
+            )
+
+        self._cached_table = table
+        self._cached_version = version
         return table
\ No newline at end of file
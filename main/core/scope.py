@@ -1,70 +1,125 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file scope.py
-# @brief Target scope loading and validation utilities.
-#
-# This module provides helper functions for loading a scope definition and
-# validating scan targets against it. Scope enforcement ensures that Deadbolt
-# only operates on explicitly permitted hosts and prevents accidental or
-# unauthorized scanning outside defined boundaries.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-from pathlib import Path
-from urllib.parse import urlparse
-import yaml
-
-
-class ScopeError(Exception):
-    """
-    Raised when one or more scan targets violate the defined scope.
-    """
-    pass
-
-
-def load_scope(scope_file: Path) -> dict:
-    """
-    Load a scope definition from a YAML file.
-
-    The scope file may define allow and deny lists used to control which
-    targets are permitted during scanning.
-    """
-    with scope_file.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
-
-
-def validate_targets(targets_file: Path, scope_file: Path):
-    """
-    Validate scan targets against a defined scope.
-
-    Each target is parsed and checked against allow and deny lists defined
-    in the scope file. Any violations are collected and raised as a single
-    ScopeError to provide clear feedback to the user.
-    """
-    scope = load_scope(scope_file)
-    allowed = set(scope.get("allow", []))
-    denied = set(scope.get("deny", []))
-
-    violations = []
-
-    with targets_file.open() as f:
-        for line in f:
-            target = line.strip()
-            if not target:
-                continue
-
-            host = urlparse(target).hostname
-            if not host:
-                continue
-
-            if host in denied:
-                violations.append(f"{host} is explicitly denied")
-
-            if allowed and host not in allowed:
-                violations.append(f"{host} is not in allow list")
-
-    if violations:
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file scope.py
+# @brief Target scope loading and validation utilities.
+#
+# This module provides helper functions for loading a scope definition and
+# validating scan targets against it. Scope enforcement ensures that Deadbolt
+# only operates on explicitly permitted hosts and prevents accidental or
+# unauthorized scanning outside defined boundaries.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Extracts the host from a target with an optional scheme and userinfo
+_HOST_RE = re.compile(
+    r"^(?:[a-z][a-z0-9+\-.]*://)?(?:[^@/?#\s]*@)?([^/:?#\s]+)",
+    re.IGNORECASE,
+)
+
+
+class ScopeError(Exception):
+    """
+    Raised when one or more scan targets violate the defined scope.
+    """
+    pass
+
+
+@lru_cache(maxsize=16)
+def _load_scope_cached(scope_file: Path, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a scope file, memoized on its path, mtime and size.
+    """
+    return yaml.load(scope_file.read_bytes(), Loader=_Loader)
+
+
+def load_scope(scope_file: Path) -> dict:
+    """
+    Load a scope definition from a YAML file.
+
+    The scope file may define allow and deny lists used to control which
+    targets are permitted during scanning.
+
+    Parsed scopes are cached until the file changes on disk, so callers
+    must treat the returned dict as read-only.
+    """
+    st = scope_file.stat()
+    return _load_scope_cached(scope_file, st.st_mtime_ns, st.st_size)
+
+
+def _target_hosts(text: str) -> set[str]:
+    """
+    Extract the unique, lowercased hostnames from a targets file body.
+
+    Both full URLs and bare hostnames (optionally with a port or path) are
+    accepted. Lines that do not start with a hostname are ignored.
+    """
+    hosts = set()
+    for line in text.splitlines():
+        m = _HOST_RE.match(line.strip())
+        if m:
+            hosts.add(m.group(1).lower())
+    return hosts
+
+
+@lru_cache(maxsize=16)
+def _scope_violations(
+    targets_file: Path,
+    targets_stat: Tuple[int, int],
+    scope_file: Path,
+    scope_stat: Tuple[int, int],
+) -> Tuple[str, ...]:
+    """
+    Compute scope violations for a targets file.
+
+    The (mtime_ns, size) stat tuples are part of the cache key so the
+    result is recomputed whenever either file changes on disk.
+    """
+    scope = load_scope(scope_file)
+    allowed = set(scope.get("allow", []))
+    denied = set(scope.get("deny", []))
+
+    hosts = _target_hosts(targets_file.read_text(encoding="utf-8"))
+
+    denied_hits = hosts & denied
+    unallowed = (hosts - allowed) if allowed else set()
+
+    violations = [f"{host} is explicitly denied" for host in sorted(denied_hits)]
+    violations += [f"{host} is not in allow list" for host in sorted(unallowed)]
+
+    return tuple(violations)
+
+
+def validate_targets(targets_file: Path, scope_file: Path):
+    """
+    Validate scan targets against a defined scope.
+
+    Each target is parsed and checked against allow and deny lists defined
+    in the scope file. Any violations are collected and raised as a single
+    ScopeError to provide clear feedback to the user.
+    """
+    t_st = targets_file.stat()
+    s_st = scope_file.stat()
+
+    violations = _scope_violations(
+        targets_file,
+        (t_st.st_mtime_ns, t_st.st_size),
+        scope_file,
+        (s_st.st_mtime_ns, s_st.st_size),
+    )
+
+    if violations:
         raise ScopeError("Scope violation:\n" + "\n".join(violations))
\ No newline at end of file
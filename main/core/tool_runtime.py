@@ -1,46 +1,74 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file tool_runtime.py
-# @brief Tool execution and parsing contract definition.
-#
-# This module defines the ToolRuntime dataclass, which describes how an
-# individual scanning tool is executed, how its output is parsed, and how
-# results are optionally post-processed. It acts as a declarative contract
-# between tool runners and the normalization pipeline.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Callable, List, Optional
-
-from main.schema.normalize import Finding
-
-
-@dataclass(frozen=True)
-class ToolRuntime:
-    """
-    Declarative runtime definition for a scanning tool.
-
-    This dataclass captures the functions and metadata required to execute a
-    tool, parse its output into normalized findings, and optionally apply
-    post-processing steps before results are consumed by the pipeline.
-    """
-
-    # Function responsible for executing the tool
-    runner: Callable[[Path, Path], None]
-
-    # Function responsible for parsing raw tool output into findings
-    parser: Callable[[Path], List[Finding]]
-
-    # Expected output filename produced by the tool (e.g. "httpx.json")
-    output_name: str
-
-    # Optional post-processing hook applied after parsing
-    postprocess: Callable[[List[Finding]], None] | None = None
-
-    # Optional subdirectory where raw output is written
-    raw_subdir: Optional[str] = None
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file tool_runtime.py
+# @brief Tool execution and parsing contract definition.
+#
+# This module defines the ToolRuntime dataclass, which describes how an
+# individual scanning tool is executed, how its output is parsed, and how
+# results are optionally post-processed. It acts as a declarative contract
+# between tool runners and the normalization pipeline.
+#
+# lazy_callable() lets registries reference runner and parser functions
+# without importing their modules until a tool actually executes.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from main.schema.normalize import Finding
+
+
+@dataclass(frozen=True)
+class ToolRuntime:
+    """
+    Declarative runtime definition for a scanning tool.
+
+    This dataclass captures the functions and metadata required to execute a
+    tool, parse its output into normalized findings, and optionally apply
+    post-processing steps before results are consumed by the pipeline.
+    """
+
+    # Function responsible for executing the tool
+    runner: Callable[[Path, Path], None]
+
+    # Function responsible for parsing raw tool output into findings. It may
+    # return a list or a generator that yields findings as they are parsed.
+    parser: Callable[[Path], Iterable[Finding]]
+
+    # Expected output filename produced by the tool (e.g. "httpx.json")
+    output_name: str
+
+    # Optional post-processing hook applied after parsing
+    postprocess: Callable[[List[Finding]], None] | None = None
+
+    # Optional subdirectory where raw output is written
+    raw_subdir: Optional[str] = None
+
+    # Files read by the tool besides its input artifact (e.g. wordlists);
+    # their contents are part of the result cache key
+    aux_inputs: Tuple[Path, ...] = ()
+
+
+def lazy_callable(module: str, attr: str) -> Callable[..., Any]:
+    """
+    Reference a function by module path without importing it yet.
+
+    The returned callable imports `module` on first invocation, caches the
+    resolved attribute, and delegates every call to it.
+    """
+    target: Optional[Callable[..., Any]] = None
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        nonlocal target
+        if target is None:
+            target = getattr(import_module(module), attr)
+        return target(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = attr
+    return call
\ No newline at end of file
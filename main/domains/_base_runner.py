@@ -0,0 +1,398 @@
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file _base_runner.py
+# @brief Shared scan orchestration for package-based domains.
+#
+# This module implements the scanning pipeline shared by the Android and iOS
+# domains. It coordinates tool execution, version detection, resumable state
+# handling, normalization of findings, metadata persistence, and final report
+# generation for a single application package (APK or IPA).
+#
+# Each domain runner supplies its own registries and input suffix; the
+# orchestration itself lives here once.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+from pathlib import Path
+from datetime import datetime, timezone
+from importlib import import_module
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Mapping,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+import multiprocessing
+import os
+import threading
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+)
+
+from main.core.execution_table import ExecutionTable
+from main.core.metadata import write_metadata
+from main.core.tool_runtime import ToolRuntime
+from main.report.generator import generate_report
+
+from main.execution.latest_version import get_latest_version
+from main.execution.version import get_tool_version
+from main.execution.version_cache import resolve_all_versions
+
+from main.utils.jsonio import concat_json_arrays, write_json_array_atomic
+from main.utils.resume import _resolve_run_base
+from main.utils.state import (
+    StateWriter,
+    load_state,
+    make_tool_state,
+    quick_fingerprint,
+)
+
+
+# Run-relative directory holding normalized findings
+NORMALIZED_DIR = "normalized"
+
+
+class ToolSpec(Protocol):
+    """
+    Fields of a domain tool specification used by the shared runner.
+
+    Satisfied structurally by the Android and iOS ToolSpec dataclasses.
+    """
+
+    name: str
+    image: str
+    parallel: bool
+
+
+def _now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string for state records.
+    """
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _publish_versions(
+    table: ExecutionTable,
+    tools: List[str],
+    installed: str,
+    latest: Optional[str],
+) -> None:
+    """
+    Publish resolved installed and latest versions for tools of one image.
+
+    Called from version resolution threads; the execution table coalesces
+    repaints, so this only marks it dirty.
+    """
+    if installed == "unknown" or latest is None:
+        update = "-"
+    elif installed == latest:
+        update = "latest"
+    else:
+        update = f"→ {latest}"
+
+    for name in tools:
+        table.set_versions(
+            name,
+            installed=installed or "unknown",
+            latest=latest,
+            update_status=update,
+        )
+
+
+def _run_one(
+    domain: str,
+    name: str,
+    input_path: Path,
+    output: Path,
+    out_json: Path,
+) -> int:
+    """
+    Execute a single tool against the package and write its parsed findings.
+
+    Findings are streamed from the parser straight into `out_json`, so the
+    full list is never materialized. They are dumped in pydantic's JSON
+    mode so timestamps are formatted identically on every install and in
+    every domain. Returns the number of findings.
+
+    Tools flagged as parallel run this in a worker process, so it only takes
+    picklable arguments and resolves the runtime from the domain's runtime
+    registry by name.
+    """
+    registry = import_module(f"main.domains.{domain}.runtime_registry")
+    runtime = registry.TOOL_RUNTIMES[name]
+    runtime.runner(input_path, output)
+    return write_json_array_atomic(
+        out_json,
+        (f.model_dump(mode="json") for f in runtime.parser(output)),
+    )
+
+
+def _run_domain(
+    *,
+    input_path: Path,
+    output_dir: Optional[Path],
+    domain: str,
+    tool_runtimes: Mapping[str, ToolRuntime],
+    tool_registry: Mapping[str, ToolSpec],
+    tools_by_phase: Mapping[str, Sequence[ToolSpec]],
+    valid_suffix: str,
+) -> None:
+    """
+    Execute the static analysis pipeline for one application package.
+
+    This function orchestrates the full lifecycle of a package scan run:
+    - Validates input
+    - Initializes output directories and state
+    - Detects tool versions asynchronously
+    - Executes tools in phase order
+    - Normalizes and aggregates findings
+    - Persists state and metadata
+    - Generates the final report
+
+    The execution is resumable and fault-tolerant: individual tool failures
+    do not abort the entire run. Phases run in the order of
+    `tools_by_phase`.
+    """
+
+    # -------------------------------
+    # Input validation
+    # -------------------------------
+    if input_path.suffix.lower() != valid_suffix:
+        raise RuntimeError(
+            f"Input must be an {valid_suffix[1:].upper()} file"
+        )
+
+    started_at = datetime.now(timezone.utc)
+
+    # -------------------------------
+    # Output directory setup
+    # -------------------------------
+    base = output_dir.resolve() if output_dir else _resolve_run_base(None)
+    run_id = base.name
+
+    raw_dir = base / "raw"
+    norm_dir = base / NORMALIZED_DIR
+    os.makedirs(norm_dir, exist_ok=True)
+
+    # Raw output directories are created once up front so worker processes
+    # never race on mkdir
+    for tool_name in tool_runtimes:
+        os.makedirs(raw_dir / tool_name, exist_ok=True)
+
+    # -------------------------------
+    # Resume state initialization
+    # -------------------------------
+    state_file = base / "state.json"
+    state = load_state(state_file)
+    state.setdefault("schema", 1)
+    state.setdefault("tools", {})
+
+    # The input never changes during a run, so it is fingerprinted at most
+    # once and only when first needed. A cold run with no completed tools
+    # has nothing to compare against and defers this until a record is
+    # written.
+    input_fp: Optional[str] = None
+
+    def fingerprint() -> str:
+        nonlocal input_fp
+        if input_fp is None:
+            input_fp = quick_fingerprint(input_path)
+        return input_fp
+
+    # -------------------------------
+    # Execution table initialization
+    # -------------------------------
+    table = ExecutionTable()
+    for tool_name in tool_runtimes:
+        table.register_tool(tool_name, "detecting…")
+    table.start()
+
+    # -------------------------------
+    # Asynchronous version detection
+    # -------------------------------
+    tools_by_image: Dict[str, List[str]] = {}
+    for spec in tool_registry.values():
+        tools_by_image.setdefault(spec.image, []).append(spec.name)
+
+    def publish(image: str, installed: str, latest: Optional[str]) -> None:
+        _publish_versions(table, tools_by_image[image], installed, latest)
+
+    # Every image is resolved in one pool on a background thread, so the
+    # display fills in while tools are already running
+    threading.Thread(
+        target=resolve_all_versions,
+        args=(list(tools_by_image),),
+        kwargs={
+            "resolve_installed": get_tool_version,
+            "resolve_latest": get_latest_version,
+            "on_resolved": publish,
+        },
+        daemon=True,
+    ).start()
+
+    # -------------------------------
+    # Tool execution loop
+    # -------------------------------
+    findings_files: List[Path] = []
+    tool_errors: Dict[str, str] = {}
+
+    def begin(spec: ToolSpec) -> Optional[Tuple[str, Path, Path]]:
+        """
+        Start a tool, returning (started_at, output, out_json) or None if
+        resumed.
+        """
+        name = spec.name
+        table.tool_started(name)
+
+        # Determine whether this tool can be resumed
+        tool_state = state["tools"].get(name)
+
+        if (
+            tool_state
+            and tool_state.get("status") == "done"
+            and tool_state.get("input_fp") == fingerprint()
+        ):
+            table.tool_skipped(name)
+            return None
+
+        output = raw_dir / name / tool_runtimes[name].output_name
+        out_json = norm_dir / f"{name}.findings.json"
+
+        return _now_iso(), output, out_json
+
+    def fail(name: str, tool_started_at: str, e: Exception) -> None:
+        # Tool-level failure handling
+        table.tool_failed(name)
+        tool_errors[name] = str(e)
+
+        state_writer.set_tool(name, make_tool_state(
+            status="failed",
+            version=table.get_version(name),
+            input_fp=fingerprint(),
+            started_at=tool_started_at,
+            finished_at=_now_iso(),
+        ))
+
+    def finish(
+        name: str,
+        tool_started_at: str,
+        out_json: Path,
+        count: int,
+    ) -> None:
+        # Successful execution path
+        table.tool_finished(name, count)
+        findings_files.append(out_json)
+
+        state_writer.set_tool(name, make_tool_state(
+            status="done",
+            version=table.get_version(name),
+            input_fp=fingerprint(),
+            output_file=f"{NORMALIZED_DIR}/{name}.findings.json",
+            started_at=tool_started_at,
+            finished_at=_now_iso(),
+        ))
+
+    # Debounced persistence of per-tool state records
+    state_writer = StateWriter(state_file, state)
+
+    try:
+        for phase_tools in tools_by_phase.values():
+            parallel_group = [t for t in phase_tools if t.parallel]
+            serial_group = [t for t in phase_tools if not t.parallel]
+
+            # -------------------------------
+            # Parallel tools (worker processes)
+            # -------------------------------
+            if parallel_group:
+                with ProcessPoolExecutor(
+                    max_workers=min(len(parallel_group), os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    futures: Dict[Future, Tuple[str, str, Path]] = {}
+                    for spec in parallel_group:
+                        started = begin(spec)
+                        if started is None:
+                            continue
+
+                        tool_started_at, output, out_json = started
+                        future = pool.submit(
+                            _run_one,
+                            domain,
+                            spec.name,
+                            input_path,
+                            output,
+                            out_json,
+                        )
+                        futures[future] = (
+                            spec.name,
+                            tool_started_at,
+                            out_json,
+                        )
+
+                    for future in as_completed(futures):
+                        name, tool_started_at, out_json = futures[future]
+                        try:
+                            count = future.result()
+                        except Exception as e:
+                            fail(name, tool_started_at, e)
+                            continue
+                        finish(name, tool_started_at, out_json, count)
+
+            # -------------------------------
+            # Serial tools
+            # -------------------------------
+            for spec in serial_group:
+                started = begin(spec)
+                if started is None:
+                    continue
+
+                tool_started_at, output, out_json = started
+                try:
+                    count = _run_one(
+                        domain, spec.name, input_path, output, out_json
+                    )
+                except Exception as e:
+                    fail(spec.name, tool_started_at, e)
+                    continue
+                finish(spec.name, tool_started_at, out_json, count)
+
+    finally:
+        # Ensure the live execution table is always stopped cleanly
+        table.stop()
+
+        state_writer.close()
+
+    # -------------------------------
+    # Finalization
+    # -------------------------------
+    finished_at = datetime.now(timezone.utc)
+
+    # Aggregate is assembled from the per-tool snapshots already on disk
+    concat_json_arrays(norm_dir / "findings.json", findings_files)
+
+    write_metadata(
+        base_dir=base,
+        run_id=run_id,
+        targets_file=input_path,
+        started_at=started_at,
+        finished_at=finished_at,
+        domain=domain,
+        tools={
+            spec.name: {
+                "image": spec.image,
+                "version": table.get_version(spec.name, "unknown"),
+            }
+            for spec in tool_registry.values()
+        },
+        errors=tool_errors,
+    )
+
+    generate_report(base)
\ No newline at end of file
@@ -1,413 +1,648 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file runner.py
-# @brief Web domain scan orchestration for Deadbolt.
-#
-# This module implements the web scanning pipeline. It coordinates discovery,
-# enumeration, and vulnerability analysis tools using a phase-based execution
-# model with explicit artifact ownership, resumable state, and scope
-# enforcement.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-import json
-import threading
-from typing import Optional, Dict, List
-from datetime import datetime, timezone
-from pathlib import Path
-
-from main.core.execution_table import ExecutionTable
-from main.core.metadata import write_metadata
-from main.core.scope import validate_targets
-from main.execution.latest_version import get_latest_version
-from main.execution.version import get_tool_version
-from main.execution.version_cache import get_cached_versions
-from main.schema.normalize import Finding
-from main.report.generator import generate_report
-from main.domains.web.runtime_registry import TOOL_RUNTIMES
-from main.domains.web.tool_registry import TOOL_REGISTRY, ToolSpec
-
-from main.utils.resume import _resolve_run_base
-from main.utils.state import hash_file, load_state, save_state
-from main.utils.targets import _extract_domains_from_targets
-from main.utils.worklists import (
-    _findings_to_work_items,
-    _write_or_merge_worklist_txt,
-)
-
-
-# Ordered execution phases for web analysis
-PHASE_ORDER = ["discovery", "enumeration", "vulnerability"]
-
-# Ensures producers run before consumers within a phase
-CONSUME_RANK = {
-    "targets": 0,
-    "assets": 1,
-    "paths": 2,
-    "findings": 3,
-}
-
-
-# ---------------------------------------------------------------------
-# Tool execution helper
-# ---------------------------------------------------------------------
-
-def run_tool(
-    *,
-    spec: ToolSpec,
-    table: ExecutionTable,
-    input_file: Path,
-    base_dir: Path,
-) -> List[Finding]:
-    """
-    Execute a single web analysis tool.
-
-    This helper resolves the tool runtime, executes the tool against the
-    provided input artifact, parses findings, and applies any optional
-    post-processing hooks.
-    """
-    table.tool_started(spec.name)
-
-    runtime = TOOL_RUNTIMES.get(spec.name)
-    if not runtime:
-        raise RuntimeError(f"No runtime registered for {spec.name}")
-
-    raw_name = runtime.raw_subdir or spec.name
-    raw_dir = base_dir / "raw" / raw_name
-    raw_dir.mkdir(parents=True, exist_ok=True)
-
-    output = raw_dir / runtime.output_name
-
-    runtime.runner(input_file, output)
-    findings = runtime.parser(output)
-
-    if runtime.postprocess:
-        runtime.postprocess(findings)
-
-    return findings
-
-
-# ---------------------------------------------------------------------
-# Main scan runner
-# ---------------------------------------------------------------------
-
-def run_web(
-    targets_path: str,
-    resume_from: Optional[Path] = None,
-) -> None:
-    """
-    Execute the web reconnaissance and vulnerability scanning pipeline.
-
-    This function enforces scope boundaries, initializes work artifacts,
-    orchestrates tools across discovery, enumeration, and vulnerability
-    phases, and persists normalized findings, metadata, and reports.
-
-    Execution is resumable and artifact-driven: tools consume and produce
-    explicit work artifacts that determine downstream execution.
-    """
-
-    targets_file = Path(targets_path)
-
-    # -------------------------------
-    # Hard scope enforcement
-    # -------------------------------
-    validate_targets(
-        targets_file=targets_file,
-        scope_file=Path("scope.yaml"),
-    )
-
-    started_at = datetime.now(timezone.utc)
-
-    # -------------------------------
-    # Resume validation
-    # -------------------------------
-    if resume_from is not None:
-        resume_from = resume_from.resolve()
-
-        if not resume_from.is_dir():
-            raise RuntimeError("--resume-from must be an existing run directory")
-
-        required = ["state.json", "work"]
-        for name in required:
-            if not (resume_from / name).exists():
-                raise RuntimeError(
-                    f"Invalid run directory (missing {name}): {resume_from}"
-                )
-
-    # -------------------------------
-    # Output directory setup
-    # -------------------------------
-    base = _resolve_run_base(resume_from)
-    base.mkdir(parents=True, exist_ok=True)
-    run_id = base.name
-
-    # Persistent state
-    state_file = base / "state.json"
-    state = load_state(state_file)
-    state.setdefault("schema", 1)
-    state.setdefault("tools", {})
-
-    norm_dir = base / "normalized"
-    work_dir = base / "work"
-    norm_dir.mkdir(parents=True, exist_ok=True)
-    work_dir.mkdir(parents=True, exist_ok=True)
-
-    # -------------------------------
-    # Initial discovery targets
-    # -------------------------------
-    domains = _extract_domains_from_targets(targets_file)
-    discovery_targets = work_dir / "targets_domains.txt"
-    _write_or_merge_worklist_txt(discovery_targets, domains)
-
-    # -------------------------------
-    # Execution table initialization
-    # -------------------------------
-    table = ExecutionTable()
-    for tool in TOOL_REGISTRY.values():
-        table.register_tool(tool.name, "detecting…")
-    table.start()
-
-    # -------------------------------
-    # Asynchronous version detection
-    # -------------------------------
-    def resolve_versions():
-        for spec in TOOL_REGISTRY.values():
-
-            def detect(tool: ToolSpec = spec):
-                installed, latest = get_cached_versions(
-                    image=tool.image,
-                    resolve_installed=get_tool_version,
-                    resolve_latest=get_latest_version,
-                )
-
-                table.versions[tool.name] = installed
-                table.latest_versions[tool.name] = latest
-
-                if latest is None:
-                    table.update_status[tool.name] = "-"
-                elif installed == latest:
-                    table.update_status[tool.name] = "latest"
-                else:
-                    table.update_status[tool.name] = latest
-
-                table._refresh()
-
-            threading.Thread(target=detect, daemon=True).start()
-
-    threading.Thread(target=resolve_versions, daemon=True).start()
-
-    # -------------------------------
-    # Artifact registry (single-owner)
-    # -------------------------------
-    artifacts: Dict[str, Path | None] = {
-        "targets": discovery_targets,
-        "assets": None,
-        "paths": None,
-        "findings": None,
-    }
-
-    # Resume artifact seeding
-    if resume_from:
-        resume_work_dir = resume_from / "work"
-
-        candidates = {
-            "targets": [resume_work_dir / "targets_domains.txt"],
-            "assets": [
-                resume_work_dir / "enumeration.assets.txt",
-                resume_work_dir / "discovery.assets.txt",
-            ],
-            "paths": [resume_work_dir / "enumeration.paths.txt"],
-        }
-
-        found_any = False
-
-        for artifact, paths in candidates.items():
-            for p in paths:
-                if p.exists():
-                    artifacts[artifact] = p
-                    found_any = True
-                    break
-
-        if not found_any:
-            raise RuntimeError("Resume directory contains no usable work artifacts")
-
-    # -------------------------------
-    # Phase execution loop
-    # -------------------------------
-    all_findings: List[Finding] = []
-    tool_errors: Dict[str, str] = {}
-
-    try:
-        for phase in PHASE_ORDER:
-            phase_tools = [
-                t for t in TOOL_REGISTRY.values()
-                if t.phase == phase
-            ]
-            phase_tools.sort(key=lambda t: CONSUME_RANK[t.consumes])
-
-            # -------------------------------
-            # Phase boundary artifact seeding
-            # -------------------------------
-            if phase == "enumeration":
-                assets = work_dir / "discovery.assets.txt"
-
-                if assets.exists() and assets.stat().st_size > 0:
-                    artifacts["assets"] = assets
-                else:
-                    fallback = work_dir / "enumeration.assets.fallback.txt"
-                    _write_or_merge_worklist_txt(
-                        fallback,
-                        _extract_domains_from_targets(targets_file),
-                    )
-                    artifacts["assets"] = fallback
-
-            if phase == "vulnerability" and artifacts["assets"] is None:
-                prev = work_dir / "enumeration.assets.txt"
-                if prev.exists():
-                    artifacts["assets"] = prev
-
-            if phase == "vulnerability" and artifacts["paths"] is None:
-                prev = work_dir / "enumeration.paths.txt"
-                if prev.exists():
-                    artifacts["paths"] = prev
-
-            # -------------------------------
-            # Tool execution
-            # -------------------------------
-            for tool in phase_tools:
-
-                input_file = artifacts.get(tool.consumes)
-                if (
-                    input_file is None
-                    or not input_file.exists()
-                    or input_file.stat().st_size == 0
-                ):
-                    table.tool_skipped(tool.name)
-                    continue
-
-                input_hash = hash_file(input_file)
-                tool_state = state["tools"].get(tool.name)
-
-                # Resume skip
-                if (
-                    tool_state
-                    and tool_state.get("status") == "done"
-                    and tool_state.get("input_hash") == input_hash
-                ):
-                    table.tool_skipped(tool.name)
-
-                    out_rel = tool_state.get("output_file")
-                    if out_rel:
-                        out_path = base / out_rel
-                        if out_path.exists():
-                            artifacts[tool.produces] = out_path
-                    continue
-
-                tool_started_at = datetime.now(timezone.utc)
-
-                try:
-                    findings = run_tool(
-                        spec=tool,
-                        table=table,
-                        input_file=input_file,
-                        base_dir=base,
-                    )
-                except Exception as e:
-                    table.tool_failed(tool.name)
-                    tool_errors[tool.name] = str(e)
-
-                    state["tools"][tool.name] = {
-                        "status": "failed",
-                        "version": table.versions.get(tool.name),
-                        "input_type": tool.consumes,
-                        "input_hash": input_hash,
-                        "started_at": tool_started_at.isoformat(),
-                        "finished_at": datetime.now(timezone.utc).isoformat(),
-                    }
-                    save_state(state_file, state)
-                    continue
-
-                table.tool_finished(tool.name, len(findings))
-
-                # Normalized snapshot
-                out_json = norm_dir / f"{tool.name}.{tool.produces}.json"
-                out_json.write_text(
-                    json.dumps(
-                        [f.model_dump() for f in findings],
-                        indent=2,
-                        default=str,
-                    ),
-                    encoding="utf-8",
-                )
-
-                # Phase-scoped artifact naming
-                if tool.name == "httpx_paths":
-                    artifact_name = f"{phase}.{tool.produces}.enriched.txt"
-                else:
-                    artifact_name = f"{phase}.{tool.produces}.txt"
-
-                out_txt = work_dir / artifact_name
-
-                items = _findings_to_work_items(tool.produces, findings)
-
-                if not out_txt.exists():
-                    out_txt.write_text("", encoding="utf-8")
-
-                if items:
-                    _write_or_merge_worklist_txt(out_txt, items)
-
-                artifacts[tool.produces] = out_txt
-
-                state["tools"][tool.name] = {
-                    "status": "done",
-                    "version": table.versions.get(tool.name),
-                    "input_type": tool.consumes,
-                    "input_hash": input_hash,
-                    "output_type": tool.produces,
-                    "output_file": str(out_txt.relative_to(base)),
-                    "started_at": tool_started_at.isoformat(),
-                    "finished_at": datetime.now(timezone.utc).isoformat(),
-                }
-                save_state(state_file, state)
-
-                if tool.produces == "findings":
-                    all_findings.extend(findings)
-
-    finally:
-        table.stop()
-
-    # -------------------------------
-    # Finalization
-    # -------------------------------
-    finished_at = datetime.now(timezone.utc)
-
-    (norm_dir / "findings.json").write_text(
-        json.dumps(
-            [f.model_dump() for f in all_findings],
-            indent=2,
-            default=str,
-        ),
-        encoding="utf-8",
-    )
-
-    write_metadata(
-        base_dir=base,
-        run_id=run_id,
-        targets_file=targets_file,
-        started_at=started_at,
-        finished_at=finished_at,
-        domain="web",
-        tools={
-            spec.name: {
-                "image": spec.image,
-                "version": table.versions.get(spec.name, "unknown"),
-            }
-            for spec in TOOL_REGISTRY.values()
-        },
-        errors=tool_errors,
-    )
-
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file runner.py
+# @brief Web domain scan orchestration for Deadbolt.
+#
+# This module implements the web scanning pipeline. It coordinates discovery,
+# enumeration, and vulnerability analysis tools using a phase-based execution
+# model with explicit artifact ownership, resumable state, and scope
+# enforcement.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Optional, Dict, List, Sequence, Set
+from datetime import datetime, timezone
+from pathlib import Path
+
+from main.core.execution_table import ExecutionTable
+from main.core.metadata import write_metadata
+from main.core.tool_runtime import ToolRuntime
+from main.core.scope import validate_targets
+from main.execution.latest_version import get_latest_version
+from main.execution.version import get_tool_version
+from main.execution.version_cache import resolve_all_versions
+from main.schema.normalize import Finding
+from main.report.generator import generate_report
+from main.domains.web.runtime_registry import BOUND_TOOLS, parse_output
+from main.domains.web.tool_registry import (
+    PHASE_ORDER,
+    Asset,
+    TOOL_REGISTRY,
+    TOOLS_BY_PHASE,
+    ToolSpec,
+)
+
+from main.utils.cas import cas_get, cas_key, cas_put
+from main.utils.jsonio import (
+    concat_json_arrays,
+    dumps_json,
+    write_bytes_atomic,
+)
+from main.utils.resume import _resolve_run_base
+from main.utils.state import (
+    StateWriter,
+    hash_file,
+    load_state,
+    make_tool_state,
+)
+from main.utils.targets import _extract_domains_from_targets
+from main.utils.worklists import (
+    _findings_to_work_items,
+    _write_or_merge_worklist_txt,
+)
+
+
+# Timezone used for every run and tool timestamp
+_UTC = timezone.utc
+
+# Upper bound on concurrent parser processes
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Run-relative directories for normalized findings and worklists
+NORMALIZED_DIR = "normalized"
+WORK_DIR = "work"
+
+
+# ---------------------------------------------------------------------
+# Timestamp helper
+# ---------------------------------------------------------------------
+
+def _now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string for state records.
+    """
+    return datetime.now(_UTC).isoformat()
+
+
+# ---------------------------------------------------------------------
+# Filesystem helper
+# ---------------------------------------------------------------------
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """
+    Stat a path, returning None if it does not exist.
+
+    Replaces exists() + stat() pairs so that existence and size are
+    obtained from a single syscall.
+    """
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+# ---------------------------------------------------------------------
+# Parser offloading
+# ---------------------------------------------------------------------
+
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+# Number of tools currently inside run_tool(), guarded by the pool lock
+_ACTIVE_TOOLS = 0
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared parser process pool, creating it on first use.
+
+    Workers are spawned rather than forked because the runner already has
+    UI, version and state threads running when the first tool finishes.
+    """
+    global _PARSE_POOL
+
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _PARSE_POOL
+
+
+def _set_tool_active(active: bool) -> None:
+    """
+    Record a tool entering or leaving run_tool().
+    """
+    global _ACTIVE_TOOLS
+
+    with _PARSE_POOL_LOCK:
+        _ACTIVE_TOOLS += 1 if active else -1
+
+
+def _parse_output(name: str, output: Path) -> List[Finding]:
+    """
+    Parse raw tool output, offloading to a worker process when useful.
+
+    Parsing large outputs (e.g. nuclei JSONL) is CPU-bound; while other
+    tools of the phase are in flight, running it out of process keeps the
+    GIL free for them and the UI. A tool running alone is parsed in
+    process, since it would only wait on the worker and pay the spawn and
+    pickling costs for nothing.
+    """
+    with _PARSE_POOL_LOCK:
+        alone = _ACTIVE_TOOLS <= 1
+
+    if alone:
+        return parse_output(name, output)
+
+    return _parse_pool().submit(parse_output, name, output).result()
+
+
+# ---------------------------------------------------------------------
+# Version detection helper
+# ---------------------------------------------------------------------
+
+def _publish_versions(
+    table: ExecutionTable,
+    tools: List[str],
+    installed: str,
+    latest: Optional[str],
+) -> None:
+    """
+    Publish resolved installed and latest versions for tools of one image.
+
+    Called from version resolution threads; the execution table coalesces
+    repaints, so this only marks it dirty.
+    """
+    if latest is None:
+        update = "-"
+    elif installed == latest:
+        update = "latest"
+    else:
+        update = latest
+
+    for name in tools:
+        table.set_versions(
+            name,
+            installed=installed,
+            latest=latest,
+            update_status=update,
+        )
+
+
+# ---------------------------------------------------------------------
+# Phase scheduling helpers
+# ---------------------------------------------------------------------
+
+def _phase_dependencies(
+    phase_tools: Sequence[ToolSpec],
+) -> Dict[str, Set[str]]:
+    """
+    Build the intra-phase dependency graph for an ordered list of tools.
+
+    A tool depends on every earlier tool in the phase that produces the
+    artifact it consumes, and on every earlier tool that consumes the
+    artifact it produces (so a worklist is never extended while an earlier
+    tool is still reading it). Edges only point forward in the consume
+    order, so the graph is always acyclic.
+    """
+    deps: Dict[str, Set[str]] = {t.name: set() for t in phase_tools}
+
+    for i, later in enumerate(phase_tools):
+        for earlier in phase_tools[:i]:
+            if (
+                earlier.produces == later.consumes
+                or earlier.consumes == later.produces
+            ):
+                deps[later.name].add(earlier.name)
+
+    return deps
+
+
+def _run_phase(
+    phase_tools: Sequence[ToolSpec],
+    execute: Callable[[ToolSpec], None],
+) -> None:
+    """
+    Execute the tools of a single phase in dependency order.
+
+    Every ready tool flagged as parallel is dispatched to a thread pool and
+    runs concurrently with the other parallel tools. Serial tools run on
+    the calling thread, one at a time, alongside whatever parallel tools
+    are in flight; the dependency graph keeps tools that share a worklist
+    apart. Exceptions raised by execute() propagate to the caller.
+    """
+    deps = _phase_dependencies(phase_tools)
+    pending = list(phase_tools)
+    done: Set[str] = set()
+    in_flight = {}
+
+    workers = max(1, sum(1 for t in phase_tools if t.parallel))
+
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="tool",
+    ) as pool:
+        while pending or in_flight:
+            ready = [t for t in pending if deps[t.name] <= done]
+
+            for tool in ready:
+                if tool.parallel:
+                    pending.remove(tool)
+                    in_flight[pool.submit(execute, tool)] = tool
+
+            serial = next((t for t in ready if not t.parallel), None)
+
+            if serial is not None:
+                # Run the next serial tool while the pool keeps working
+                pending.remove(serial)
+                execute(serial)
+                done.add(serial.name)
+            elif in_flight:
+                wait(in_flight, return_when=FIRST_COMPLETED)
+
+            for future in [f for f in in_flight if f.done()]:
+                tool = in_flight.pop(future)
+                future.result()
+                done.add(tool.name)
+
+
+# ---------------------------------------------------------------------
+# Tool execution helper
+# ---------------------------------------------------------------------
+
+def run_tool(
+    *,
+    spec: ToolSpec,
+    runtime: ToolRuntime,
+    table: ExecutionTable,
+    input_file: Path,
+    input_hash: str,
+    base_dir: Path,
+) -> List[Finding]:
+    """
+    Execute a single web analysis tool.
+
+    This helper executes the tool's bound runtime against the provided
+    input artifact, parses findings, and applies any optional
+    post-processing hooks.
+
+    Results are shared across runs through the content-addressed cache:
+    when the same tool version already processed an identical input, the
+    cached raw output is restored instead of running the container again.
+    The output is always parsed here, so evidence paths and timestamps
+    belong to the current run.
+    """
+    table.tool_started(spec.name)
+
+    raw_name = runtime.raw_subdir or spec.name
+    output = base_dir / "raw" / raw_name / runtime.output_name
+
+    key = cas_key(
+        spec.name,
+        input_hash,
+        table.get_version(spec.name),
+        runtime.aux_inputs,
+    )
+    cached = key is not None and cas_get(key, output)
+
+    _set_tool_active(True)
+    try:
+        if not cached:
+            runtime.runner(input_file, output)
+
+        findings = _parse_output(spec.name, output)
+    finally:
+        _set_tool_active(False)
+
+    if key is not None and not cached and findings:
+        cas_put(key, output)
+
+    if runtime.postprocess:
+        runtime.postprocess(findings)
+
+    return findings
+
+
+# ---------------------------------------------------------------------
+# Main scan runner
+# ---------------------------------------------------------------------
+
+def run_web(
+    targets_path: str,
+    resume_from: Optional[Path] = None,
+) -> None:
+    """
+    Execute the web reconnaissance and vulnerability scanning pipeline.
+
+    This function enforces scope boundaries, initializes work artifacts,
+    orchestrates tools across discovery, enumeration, and vulnerability
+    phases, and persists normalized findings, metadata, and reports.
+
+    Execution is resumable and artifact-driven: tools consume and produce
+    explicit work artifacts that determine downstream execution.
+    """
+
+    targets_file = Path(targets_path)
+
+    # -------------------------------
+    # Hard scope enforcement
+    # -------------------------------
+    validate_targets(
+        targets_file=targets_file,
+        scope_file=Path("scope.yaml"),
+    )
+
+    started_at = datetime.now(_UTC)
+
+    # -------------------------------
+    # Resume validation
+    # -------------------------------
+    if resume_from is not None:
+        resume_from = resume_from.resolve()
+
+        if not resume_from.is_dir():
+            raise RuntimeError("--resume-from must be an existing run directory")
+
+        required = ["state.json", "work"]
+        for name in required:
+            if not (resume_from / name).exists():
+                raise RuntimeError(
+                    f"Invalid run directory (missing {name}): {resume_from}"
+                )
+
+    # -------------------------------
+    # Output directory setup
+    # -------------------------------
+    base = _resolve_run_base(resume_from)
+    base.mkdir(parents=True, exist_ok=True)
+    run_id = base.name
+
+    # Persistent state
+    state_file = base / "state.json"
+    state = load_state(state_file)
+    state.setdefault("schema", 1)
+    state.setdefault("tools", {})
+
+    norm_dir = base / NORMALIZED_DIR
+    work_dir = base / WORK_DIR
+    norm_dir.mkdir(parents=True, exist_ok=True)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    # Raw output directories are created once up front so tools running
+    # concurrently never race on mkdir
+    for name, (_, runtime) in BOUND_TOOLS.items():
+        os.makedirs(base / "raw" / (runtime.raw_subdir or name), exist_ok=True)
+
+    # -------------------------------
+    # Initial discovery targets
+    # -------------------------------
+    domains = _extract_domains_from_targets(targets_file)
+    discovery_targets = work_dir / "targets_domains.txt"
+    _write_or_merge_worklist_txt(discovery_targets, domains)
+
+    # -------------------------------
+    # Execution table initialization
+    # -------------------------------
+    table = ExecutionTable()
+    for tool in TOOL_REGISTRY.values():
+        table.register_tool(tool.name, "detecting…")
+    table.start()
+
+    # -------------------------------
+    # Asynchronous version detection
+    # -------------------------------
+    tools_by_image: Dict[str, List[str]] = {}
+    for spec in TOOL_REGISTRY.values():
+        tools_by_image.setdefault(spec.image, []).append(spec.name)
+
+    def publish(image: str, installed: str, latest: Optional[str]) -> None:
+        _publish_versions(table, tools_by_image[image], installed, latest)
+
+    # Every image is resolved in one pool on a background thread, so the
+    # display fills in while tools are already running
+    threading.Thread(
+        target=resolve_all_versions,
+        args=(list(tools_by_image),),
+        kwargs={
+            "resolve_installed": get_tool_version,
+            "resolve_latest": get_latest_version,
+            "on_resolved": publish,
+        },
+        daemon=True,
+    ).start()
+
+    # -------------------------------
+    # Artifact registry (single-owner)
+    # -------------------------------
+    artifacts: List[Path | None] = [None] * len(Asset)
+    artifacts[Asset.targets] = discovery_targets
+
+    # Resume artifact seeding
+    if resume_from:
+        resume_work_dir = resume_from / "work"
+
+        candidates = {
+            Asset.targets: [resume_work_dir / "targets_domains.txt"],
+            Asset.assets: [
+                resume_work_dir / "enumeration.assets.txt",
+                resume_work_dir / "discovery.assets.txt",
+            ],
+            Asset.paths: [resume_work_dir / "enumeration.paths.txt"],
+        }
+
+        found_any = False
+
+        for artifact, paths in candidates.items():
+            for p in paths:
+                if _stat_or_none(p) is not None:
+                    artifacts[artifact] = p
+                    found_any = True
+                    break
+
+        if not found_any:
+            raise RuntimeError("Resume directory contains no usable work artifacts")
+
+    # -------------------------------
+    # Per-tool execution
+    # -------------------------------
+    findings_files: List[Path] = []
+    tool_errors: Dict[str, str] = {}
+
+    # Guards artifacts, state, worklists and aggregates when tools of the
+    # same phase run concurrently
+    lock = threading.Lock()
+
+    # Debounced persistence of per-tool state records
+    state_writer = StateWriter(state_file, state)
+
+    def execute(tool: ToolSpec) -> None:
+        with lock:
+            input_file = artifacts[tool.consumes]
+
+        st = _stat_or_none(input_file) if input_file is not None else None
+        if st is None or st.st_size == 0:
+            table.tool_skipped(tool.name)
+            return
+
+        input_hash = hash_file(input_file)
+        tool_state = state["tools"].get(tool.name)
+
+        # Resume skip
+        if (
+            tool_state
+            and tool_state.get("status") == "done"
+            and tool_state.get("input_hash") == input_hash
+        ):
+            table.tool_skipped(tool.name)
+
+            out_rel = tool_state.get("output_file")
+            if out_rel:
+                out_path = base / out_rel
+                if out_path.exists():
+                    with lock:
+                        artifacts[tool.produces] = out_path
+            return
+
+        _, runtime = BOUND_TOOLS[tool.name]
+        tool_started_at = _now_iso()
+
+        try:
+            findings = run_tool(
+                spec=tool,
+                runtime=runtime,
+                table=table,
+                input_file=input_file,
+                input_hash=input_hash,
+                base_dir=base,
+            )
+        except Exception as e:
+            table.tool_failed(tool.name)
+
+            with lock:
+                tool_errors[tool.name] = str(e)
+                state_writer.set_tool(tool.name, make_tool_state(
+                    status="failed",
+                    version=table.get_version(tool.name),
+                    input_type=tool.consumes.name,
+                    input_hash=input_hash,
+                    started_at=tool_started_at,
+                    finished_at=_now_iso(),
+                ))
+            return
+
+        table.tool_finished(tool.name, len(findings))
+
+        # Normalized snapshot
+        out_json = norm_dir / f"{tool.name}.{tool.produces.name}.json"
+        write_bytes_atomic(
+            out_json,
+            dumps_json([f.model_dump(mode="json") for f in findings]),
+        )
+
+        # Phase-scoped artifact naming
+        if tool.name == "httpx_paths":
+            artifact_name = f"{tool.phase}.{tool.produces.name}.enriched.txt"
+        else:
+            artifact_name = f"{tool.phase}.{tool.produces.name}.txt"
+
+        out_txt = work_dir / artifact_name
+
+        with lock:
+            written = _write_or_merge_worklist_txt(
+                out_txt,
+                _findings_to_work_items(tool.produces.name, findings),
+            )
+
+            # Downstream tools expect the artifact to exist even when empty
+            if not written and _stat_or_none(out_txt) is None:
+                out_txt.write_text("", encoding="utf-8")
+
+            artifacts[tool.produces] = out_txt
+
+            state_writer.set_tool(tool.name, make_tool_state(
+                status="done",
+                version=table.get_version(tool.name),
+                input_type=tool.consumes.name,
+                input_hash=input_hash,
+                output_type=tool.produces.name,
+                output_file=f"{WORK_DIR}/{artifact_name}",
+                started_at=tool_started_at,
+                finished_at=_now_iso(),
+            ))
+
+            if tool.produces is Asset.findings:
+                findings_files.append(out_json)
+
+    # -------------------------------
+    # Phase execution loop
+    # -------------------------------
+    try:
+        for phase in PHASE_ORDER:
+            phase_tools = TOOLS_BY_PHASE[phase]
+
+            # -------------------------------
+            # Phase boundary artifact seeding
+            # -------------------------------
+            if phase == "enumeration":
+                assets = work_dir / "discovery.assets.txt"
+
+                st = _stat_or_none(assets)
+                if st is not None and st.st_size > 0:
+                    artifacts[Asset.assets] = assets
+                else:
+                    fallback = work_dir / "enumeration.assets.fallback.txt"
+                    _write_or_merge_worklist_txt(
+                        fallback,
+                        _extract_domains_from_targets(targets_file),
+                    )
+                    artifacts[Asset.assets] = fallback
+
+            if phase == "vulnerability" and artifacts[Asset.assets] is None:
+                prev = work_dir / "enumeration.assets.txt"
+                if prev.exists():
+                    artifacts[Asset.assets] = prev
+
+            if phase == "vulnerability" and artifacts[Asset.paths] is None:
+                prev = work_dir / "enumeration.paths.txt"
+                if prev.exists():
+                    artifacts[Asset.paths] = prev
+
+            # -------------------------------
+            # Tool execution
+            # -------------------------------
+            _run_phase(phase_tools, execute)
+
+    finally:
+        table.stop()
+        state_writer.close()
+
+    # -------------------------------
+    # Finalization
+    # -------------------------------
+    finished_at = datetime.now(_UTC)
+
+    # Aggregate is assembled from the per-tool snapshots already on disk
+    concat_json_arrays(norm_dir / "findings.json", findings_files)
+
+    write_metadata(
+        base_dir=base,
+        run_id=run_id,
+        targets_file=targets_file,
+        started_at=started_at,
+        finished_at=finished_at,
+        domain="web",
+        tools={
+            spec.name: {
+                "image": spec.image,
+                "version": table.get_version(spec.name, "unknown"),
+            }
+            for spec in TOOL_REGISTRY.values()
+        },
+        errors=tool_errors,
+    )
+
     generate_report(base)
\ No newline at end of file
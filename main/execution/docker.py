@@ -1,67 +1,82 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file container.py
-# @brief Docker container execution helper.
-#
-# This module provides a thin wrapper around `docker run` used to execute
-# tool containers in a controlled and reproducible manner. It is responsible
-# for assembling the container invocation, mounting required volumes, and
-# propagating execution failures with useful diagnostics.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-import subprocess
-from pathlib import Path
-from typing import Dict, List, Optional
-
-
-def run_container(
-    *,
-    image: str,
-    args: List[str],
-    mounts: Dict[Path, str],
-    entrypoint: Optional[str] = None,
-):
-    """
-    Execute a Docker container with mounted volumes.
-
-    This helper constructs and executes a `docker run` command using the
-    provided image, arguments, and host-to-container volume mappings.
-    Execution output is captured, and failures are raised as runtime errors
-    with full stdout and stderr context.
-
-    At least one volume mount is required to ensure deterministic input
-    and output handling.
-    """
-    if not mounts:
-        raise ValueError("run_container() requires at least one volume mount")
-
-    cmd = ["docker", "run", "--rm"]
-
-    # Register host-to-container volume mounts
-    for host, container in mounts.items():
-        cmd += ["-v", f"{host.resolve()}:{container}"]
-
-    # Optional entrypoint override
-    if entrypoint:
-        cmd += ["--entrypoint", entrypoint]
-
-    # Image and arguments
-    cmd.append(image)
-    cmd.extend(args)
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
-        raise RuntimeError(
-            "Docker failed\n"
-            f"STDERR:\n{result.stderr}\n"
-            f"STDOUT:\n{result.stdout}"
-        )
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file container.py
+# @brief Docker container execution helper.
+#
+# This module provides a thin wrapper around `docker run` used to execute
+# tool containers in a controlled and reproducible manner. It is responsible
+# for assembling the container invocation, mounting required volumes, and
+# propagating execution failures with useful diagnostics.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional
+
+# Amount of trailing stdout/stderr included in failure diagnostics
+ERROR_TAIL_BYTES = 64 * 1024
+
+
+def _tail(stream: BinaryIO, limit: int = ERROR_TAIL_BYTES) -> str:
+    """
+    Return the last `limit` bytes of a spooled stream as text.
+    """
+    size = stream.seek(0, 2)
+    stream.seek(max(size - limit, 0))
+    text = stream.read().decode("utf-8", errors="replace")
+    return text if size <= limit else "…" + text
+
+
+def run_container(
+    *,
+    image: str,
+    args: List[str],
+    mounts: Dict[Path, str],
+    entrypoint: Optional[str] = None,
+):
+    """
+    Execute a Docker container with mounted volumes.
+
+    This helper constructs and executes a `docker run` command using the
+    provided image, arguments, and host-to-container volume mappings.
+    Tools write their results through the mounted volumes, so console
+    output is spooled to temporary files rather than held in memory;
+    failures are raised as runtime errors with the tail of stdout and
+    stderr as context.
+
+    At least one volume mount is required to ensure deterministic input
+    and output handling.
+    """
+    if not mounts:
+        raise ValueError("run_container() requires at least one volume mount")
+
+    # Host-to-container volume mounts. Docker needs absolute host paths but
+    # resolves symlinks itself, so a lexical absolute path avoids stat-ing
+    # every parent directory on each container spawn.
+    mount_args = [
+        arg
+        for host, container in mounts.items()
+        for arg in ("-v", f"{os.path.abspath(host)}:{container}")
+    ]
+
+    # Optional entrypoint override
+    entry_args = ("--entrypoint", entrypoint) if entrypoint else ()
+
+    # Full argv assembled in one pass: mounts, entrypoint, image, arguments
+    cmd = ["docker", "run", "--rm", *mount_args, *entry_args, image, *args]
+
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        result = subprocess.run(cmd, stdout=out, stderr=err)
+
+        if result.returncode != 0:
+            raise RuntimeError(
+                "Docker failed\n"
+                f"STDERR:\n{_tail(err)}\n"
+                f"STDOUT:\n{_tail(out)}"
+            )
\ No newline at end of file
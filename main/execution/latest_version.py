@@ -1,74 +1,184 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file latest_version.py
-# @brief Resolve latest upstream tool versions from GitHub.
-#
-# This module provides a helper for resolving the latest released version of
-# a tool based on its associated GitHub repository. Version resolution is
-# best-effort and intended for informational display only; failures do not
-# affect execution.
-#
-# Results are cached to minimize external requests during a single run.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-import requests
-from functools import lru_cache
-
-
-# Mapping of Deadbolt container images to upstream GitHub repositories
-REPO_MAP = {
-    # Discovery
-    "deadbolt-subfinder": "projectdiscovery/subfinder",
-    "deadbolt-dnsx": "projectdiscovery/dnsx",
-    "deadbolt-httpx": "projectdiscovery/httpx",
-    "deadbolt-apktool": "iBotPeaches/Apktool",
-    "deadbolt-androguard": "androguard/androguard",
-
-    # Enumeration
-    "deadbolt-katana": "projectdiscovery/katana",
-    "deadbolt-gau": "lc/gau",
-    "deadbolt-ffuf": "ffuf/ffuf",
-    "deadbolt-hakrawler": "hakluke/hakrawler",
-    "deadbolt-waybackurls": "tomnomnom/waybackurls",
-
-    # Vulnerability / Analysis
-    "deadbolt-nuclei": "projectdiscovery/nuclei",
-    "deadbolt-paramspider": "devanshbatham/ParamSpider",
-    "deadbolt-graphql-cop": "dolevf/graphql-cop",
-    "deadbolt-jadx": "skylot/jadx",
-    "opensecurity/mobile-security-framework-mobsf":"MobSF/Mobile-Security-Framework-MobSF",
-}
-
-
-@lru_cache(maxsize=32)
-def get_latest_version(image: str) -> str | None:
-    """
-    Resolve the latest upstream release version for a tool image.
-
-    This function maps a Deadbolt container image to its corresponding
-    GitHub repository and queries the GitHub Releases API for the latest
-    published version.
-
-    The result is cached to reduce API usage. Any network or API failures
-    return None and are treated as non-fatal.
-    """
-    repo = REPO_MAP.get(image)
-    if not repo:
-        return None
-
-    url = f"https://api.github.com/repos/{repo}/releases/latest"
-
-    try:
-        r = requests.get(url, timeout=5)
-    except Exception:
-        return None
-
-    if r.status_code != 200:
-        return None
-
-    tag = r.json().get("tag_name")
-    return tag.lstrip("v") if tag else None
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file latest_version.py
+# @brief Resolve latest upstream tool versions from GitHub.
+#
+# This module provides a helper for resolving the latest released version of
+# a tool based on its associated GitHub repository. Version resolution is
+# best-effort and intended for informational display only; failures do not
+# affect execution.
+#
+# Lookups share one keep-alive HTTP session, are safe to run concurrently
+# from the version resolution pool, and are cached in-process and in the
+# persistent version cache to minimize external requests across runs.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from main.execution.version_cache import cached_field, is_valid, store_field
+
+
+# Mapping of Deadbolt container images to upstream GitHub repositories
+REPO_MAP = {
+    # Discovery
+    "deadbolt-subfinder": "projectdiscovery/subfinder",
+    "deadbolt-dnsx": "projectdiscovery/dnsx",
+    "deadbolt-httpx": "projectdiscovery/httpx",
+    "deadbolt-apktool": "iBotPeaches/Apktool",
+    "deadbolt-androguard": "androguard/androguard",
+
+    # Enumeration
+    "deadbolt-katana": "projectdiscovery/katana",
+    "deadbolt-gau": "lc/gau",
+    "deadbolt-ffuf": "ffuf/ffuf",
+    "deadbolt-hakrawler": "hakluke/hakrawler",
+    "deadbolt-waybackurls": "tomnomnom/waybackurls",
+
+    # Vulnerability / Analysis
+    "deadbolt-nuclei": "projectdiscovery/nuclei",
+    "deadbolt-paramspider": "devanshbatham/ParamSpider",
+    "deadbolt-graphql-cop": "dolevf/graphql-cop",
+    "deadbolt-jadx": "skylot/jadx",
+    "opensecurity/mobile-security-framework-mobsf":"MobSF/Mobile-Security-Framework-MobSF",
+}
+
+
+# Transient connection errors and gateway failures are retried briefly on
+# the pooled connection instead of failing the lookup outright
+RETRY = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
+# Shared HTTP session so lookups reuse pooled TLS connections
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=RETRY),
+)
+
+# Resolved versions per image for this process. Reads are lock-free; a
+# single dict lookup is atomic, and the lock only guards writers.
+_LATEST: Dict[str, Optional[str]] = {}
+
+# Marks an image not yet resolved (None is a valid resolved result)
+_UNRESOLVED = object()
+
+# Last (ETag, tag) seen per repository, used for conditional requests
+_ETAGS: Dict[str, Tuple[str, Optional[str]]] = {}
+
+_LOCK = threading.Lock()
+
+
+def _fetch_redirect(repo: str) -> Optional[str]:
+    """
+    Read the latest tag of a repository from the releases redirect.
+
+    github.com answers /releases/latest with a redirect to the tagged
+    release, so a HEAD request yields the tag from the Location header
+    without a response body, JSON decoding, or the API rate limit.
+    Returns None when no tagged redirect is received.
+    """
+    url = f"https://github.com/{repo}/releases/latest"
+
+    try:
+        r = _SESSION.head(url, allow_redirects=False, timeout=5)
+    except Exception:
+        return None
+
+    location = r.headers.get("Location", "")
+    if not (300 <= r.status_code < 400 and "/tag/" in location):
+        return None
+
+    tag = unquote(location.rsplit("/tag/", 1)[1])
+    return tag.lstrip("v") or None
+
+
+def _fetch_api(repo: str) -> Optional[str]:
+    """
+    Query the GitHub Releases API for the latest tag of a repository.
+
+    A previously seen ETag is sent as If-None-Match; a 304 response
+    reuses the stored tag without downloading or decoding the release.
+    """
+    url = f"https://api.github.com/repos/{repo}/releases/latest"
+
+    with _LOCK:
+        known = _ETAGS.get(repo)
+
+    headers = {"If-None-Match": known[0]} if known else {}
+
+    try:
+        r = _SESSION.get(url, headers=headers, timeout=5)
+    except Exception:
+        return None
+
+    if r.status_code == 304 and known:
+        return known[1]
+
+    if r.status_code != 200:
+        return None
+
+    tag = r.json().get("tag_name")
+    version = tag.lstrip("v") if tag else None
+
+    etag = r.headers.get("ETag")
+    if etag:
+        with _LOCK:
+            _ETAGS[repo] = (etag, version)
+
+    return version
+
+
+def _fetch(repo: str) -> Optional[str]:
+    """
+    Resolve the latest tag of a repository.
+
+    The lightweight releases redirect is tried first; the Releases API
+    is only queried when it does not yield a tag.
+    """
+    return _fetch_redirect(repo) or _fetch_api(repo)
+
+
+def get_latest_version(image: str) -> str | None:
+    """
+    Resolve the latest upstream release version for a tool image.
+
+    This function maps a Deadbolt container image to its corresponding
+    GitHub repository and resolves its latest published release, via the
+    releases redirect or, failing that, the GitHub Releases API.
+
+    The result is cached in-process and in the persistent version cache,
+    so warm runs within the cache TTL make no request at all. Any network
+    or API failures return None and are treated as non-fatal.
+    """
+    known = _LATEST.get(image, _UNRESOLVED)
+    if known is not _UNRESOLVED:
+        return known
+
+    repo = REPO_MAP.get(image)
+    if not repo:
+        return None
+
+    # Fresh results from earlier runs avoid the network entirely
+    version = cached_field(image, "latest")
+    if version is None:
+        version = _fetch(repo)
+        if is_valid(version):
+            store_field(image, "latest", version)
+
+    with _LOCK:
+        _LATEST[image] = version
+    return version
\ No newline at end of file
@@ -1,92 +1,373 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file version.py
-# @brief Resolve installed tool versions from container images.
-#
-# This module provides a best-effort mechanism for determining the installed
-# version of a tool by executing its container image and inspecting version
-# output. It includes explicit overrides for tools that do not expose a
-# reliable CLI version flag.
-#
-# Results are cached to avoid repeated container execution during a run.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-import subprocess
-import re
-from functools import lru_cache
-from typing import Optional
-
-# Regular expression used to extract semantic version strings
-VERSION_RE = re.compile(r"(?:v)?\d+\.\d+\.\d+")
-
-# Common CLI flags used to query tool versions
-VERSION_FLAGS = ["-version", "--version", "version"]
-
-
-@lru_cache(maxsize=32)
-def get_tool_version(image: str) -> str:
-    """
-    Resolve the installed version of a tool from its container image.
-
-    This function attempts to determine the tool version by running the
-    container image with common version flags and parsing the output.
-    For tools that do not expose a reliable CLI version, explicit mappings
-    are used as a fallback.
-
-    Resolution is best-effort: failures return "unknown" and do not affect
-    execution.
-    """
-
-    # -------------------------------
-    # Explicit version mappings
-    # -------------------------------
-
-    # MobSF does not expose a stable CLI version
-    if image == "opensecurity/mobile-security-framework-mobsf":
-        return "4.4.5"
-
-    # graphql-cop does not reliably expose version information
-    if image == "deadbolt-graphql-cop":
-        return "1.15"
-
-    # hakrawler version is not consistently exposed via CLI
-    if image == "deadbolt-hakrawler":
-        return "2.1"
-
-    # ParamSpider does not provide a standard version flag
-    if image == "deadbolt-paramspider":
-        return "1.0.1"
-
-    # waybackurls version is static and not printed via CLI
-    if image == "deadbolt-waybackurls":
-        return "0.1.0"
-    
-    # apktool version is available via docker run --rm --entrypoint /bin/sh deadbolt-apktool -c "java -jar /usr/local/bin/apktool.jar --version" but better to be static
-    if image == "deadbolt-apktool":
-        return "2.12.1"
-
-    # -------------------------------
-    # Generic CLI-based detection
-    # -------------------------------
-
-    for flag in VERSION_FLAGS:
-        try:
-            result = subprocess.run(
-                ["docker", "run", "--rm", image, flag],
-                capture_output=True,
-                text=True,
-                timeout=8,
-            )
-        except Exception:
-            continue
-
-        output = (result.stdout or "") + (result.stderr or "")
-        match = VERSION_RE.search(output)
-        if match:
-            return match.group(0).lstrip("v")
-
-    return "unknown"
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file version.py
+# @brief Resolve installed tool versions from container images.
+#
+# This module provides a best-effort mechanism for determining the installed
+# version of a tool by executing its container image and inspecting version
+# output. It includes explicit overrides for tools that do not expose a
+# reliable CLI version flag.
+#
+# Results are cached to avoid repeated container execution during a run, and
+# persisted per image ID so later runs skip the container entirely until the
+# image is rebuilt.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import json
+import subprocess
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from main.execution.version_cache import cached_entry, is_valid, store_field
+
+# Regular expression used to extract semantic version strings
+VERSION_RE = re.compile(r"(?:v)?\d+\.\d+\.\d+")
+
+# Version banners are printed first, so only the head of probe output is
+# searched; verbose tools can print many kilobytes after it
+VERSION_SCAN_LIMIT = 4096
+
+# Common CLI flags used to query tool versions
+VERSION_FLAGS = ["-version", "--version", "version"]
+
+# Time limit for a single version probe container (seconds)
+PROBE_TIMEOUT = 8
+
+# Interval at which a running probe checks for cancellation (seconds)
+PROBE_POLL = 0.1
+
+# Exit status of the shell probe when no flag printed a version
+_SHELL_NO_VERSION = 3
+
+# Standard OCI image label carrying the packaged software version
+OCI_VERSION_LABEL = "org.opencontainers.image.version"
+
+# Line prefix the shell probe uses to report which flag succeeded
+_FLAG_MARKER = "@deadbolt-flag="
+_FLAG_MARKER_RE = re.compile(rf"^{re.escape(_FLAG_MARKER)}(\S+)$", re.M)
+
+
+def _find_version(text: str, start: int = 0) -> Optional[str]:
+    """
+    Return the first dotted version in `text` after `start`, without a
+    leading "v", searching at most VERSION_SCAN_LIMIT characters.
+    """
+    match = VERSION_RE.search(text, start, start + VERSION_SCAN_LIMIT)
+    return match.group(0).lstrip("v") if match else None
+
+
+def _ordered_flags(first: Optional[str]) -> List[str]:
+    """
+    Return VERSION_FLAGS with a previously successful flag moved first.
+    """
+    if first not in VERSION_FLAGS:
+        return list(VERSION_FLAGS)
+    return [first] + [f for f in VERSION_FLAGS if f != first]
+
+
+def _shell_probe_script(flags: List[str]) -> str:
+    """
+    Build the shell loop run inside one probe container.
+
+    "$@" is the image entrypoint; it is invoked with each flag in order
+    and the first output that looks like a dotted version is printed
+    after a marker line naming the flag.
+    """
+    return (
+        "for f in " + " ".join(flags) + "; do "
+        'out=$("$@" "$f" 2>&1); '
+        'case "$out" in *[0-9].[0-9]*.[0-9]*) '
+        f'printf "{_FLAG_MARKER}%s\\n%s\\n" "$f" "$out"; exit 0;; esac; '
+        f"done; exit {_SHELL_NO_VERSION}"
+    )
+
+
+def _inspect_image(
+    image: str,
+) -> Tuple[Optional[str], List[str], Optional[str]]:
+    """
+    Return the local image ID, entrypoint and OCI version label of a
+    container image.
+
+    `docker image inspect` reads local metadata only and does not start
+    a container, so it is far cheaper than a version probe. The label is
+    None unless it holds a dotted version. Unknown images yield
+    (None, [], None).
+    """
+    try:
+        result = subprocess.run(
+            [
+                "docker", "image", "inspect",
+                "--format",
+                "{{.Id}}\n{{json .Config.Entrypoint}}"
+                "\n{{json .Config.Labels}}",
+                image,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=8,
+        )
+    except Exception:
+        return None, [], None
+
+    if result.returncode != 0:
+        return None, [], None
+
+    image_id, _, rest = result.stdout.strip().partition("\n")
+    entrypoint, _, labels = rest.partition("\n")
+    try:
+        argv = json.loads(entrypoint) or []
+        label = (json.loads(labels) or {}).get(OCI_VERSION_LABEL) or ""
+    except (ValueError, AttributeError):
+        argv, label = [], ""
+
+    return image_id or None, [str(a) for a in argv], _find_version(str(label))
+
+
+def _stop_probe(proc: subprocess.Popen) -> None:
+    """
+    Stop a probe container client and reap it.
+
+    SIGTERM is proxied by `docker run` to the container, which is then
+    removed by --rm; SIGKILL is only used if the client does not exit.
+    """
+    proc.terminate()
+    try:
+        proc.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+    proc.stdout.close()
+
+
+def _run_probe(
+    cmd: List[str],
+    cancel: threading.Event,
+) -> Optional[Tuple[int, str]]:
+    """
+    Run a probe container and return (exit code, combined output).
+
+    Returns None if the container could not be started, PROBE_TIMEOUT
+    elapsed, or `cancel` was set; the container is stopped in the latter
+    two cases.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+    except Exception:
+        return None
+
+    deadline = time.monotonic() + PROBE_TIMEOUT
+
+    while True:
+        try:
+            output, _ = proc.communicate(timeout=PROBE_POLL)
+            return proc.returncode, output or ""
+        except subprocess.TimeoutExpired:
+            if cancel.is_set() or time.monotonic() > deadline:
+                _stop_probe(proc)
+                return None
+
+
+def _probe(image: str, flag: str, cancel: threading.Event) -> Optional[str]:
+    """
+    Run the image with one version flag and parse its version, or None.
+    """
+    result = _run_probe(["docker", "run", "--rm", image, flag], cancel)
+    if result is None:
+        return None
+
+    return _find_version(result[1])
+
+
+def _probe_shell(
+    image: str,
+    entrypoint: List[str],
+    flags: List[str],
+) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Try every version flag inside a single container.
+
+    The image entrypoint is invoked from /bin/sh with each flag in turn
+    until one prints something version-like. Returns (version, flag),
+    ("unknown", None) if no flag produced one, or None when the shell
+    path is unusable (no shell in the image, timeout) and the caller
+    should fall back to per-flag containers.
+    """
+    result = _run_probe(
+        [
+            "docker", "run", "--rm",
+            "--entrypoint", "/bin/sh",
+            image,
+            "-c", _shell_probe_script(flags),
+            "sh",
+            *entrypoint,
+        ],
+        threading.Event(),
+    )
+    if result is None:
+        return None
+
+    returncode, output = result
+
+    marker = _FLAG_MARKER_RE.search(output)
+    version = _find_version(output, marker.end() if marker else 0)
+    if version:
+        return version, marker.group(1) if marker else None
+
+    if returncode == _SHELL_NO_VERSION:
+        return "unknown", None
+    return None
+
+
+def _probe_parallel(image: str) -> Tuple[str, Optional[str]]:
+    """
+    Probe the image with every version flag concurrently.
+
+    The first probe to report a version wins and the remaining probe
+    containers are stopped, so the worst case is one PROBE_TIMEOUT rather
+    than one per flag. Returns (version, flag) or ("unknown", None).
+    """
+    cancel = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=len(VERSION_FLAGS)) as pool:
+        futures = {
+            pool.submit(_probe, image, flag, cancel): flag
+            for flag in VERSION_FLAGS
+        }
+
+        try:
+            for future in as_completed(futures):
+                version = future.result()
+                if version:
+                    return version, futures[future]
+        finally:
+            cancel.set()
+
+    return "unknown", None
+
+
+def _probe_version(
+    image: str,
+    entrypoint: List[str],
+    winning_flag: Optional[str] = None,
+) -> Tuple[str, Optional[str]]:
+    """
+    Resolve a version by running the image, using as few containers as
+    possible.
+
+    Images with a known entrypoint are probed with a single shell
+    container, trying the flag that worked last time first; scratch and
+    distroless images without a shell, and images whose entrypoint is
+    unknown, fall back to one container per flag. Returns the version
+    and the flag that produced it.
+    """
+    if entrypoint:
+        result = _probe_shell(
+            image,
+            entrypoint,
+            _ordered_flags(winning_flag),
+        )
+        if result is not None:
+            return result
+
+    return _probe_parallel(image)
+
+
+@lru_cache(maxsize=32)
+def get_tool_version(image: str) -> str:
+    """
+    Resolve the installed version of a tool from its container image.
+
+    This function attempts to determine the tool version by running the
+    container image with common version flags and parsing the output.
+    For tools that do not expose a reliable CLI version, explicit mappings
+    are used as a fallback.
+
+    Images labelled with org.opencontainers.image.version are answered
+    from that label without starting a container. Otherwise, probed
+    versions are persisted together with the local image ID and
+    the flag that produced them. While the image is unchanged later runs
+    reuse the stored version without starting a container; after a
+    rebuild the remembered flag is tried first.
+
+    Resolution is best-effort: failures return "unknown" and do not affect
+    execution.
+    """
+
+    # -------------------------------
+    # Explicit version mappings
+    # -------------------------------
+
+    # MobSF does not expose a stable CLI version
+    if image == "opensecurity/mobile-security-framework-mobsf":
+        return "4.4.5"
+
+    # graphql-cop does not reliably expose version information
+    if image == "deadbolt-graphql-cop":
+        return "1.15"
+
+    # hakrawler version is not consistently exposed via CLI
+    if image == "deadbolt-hakrawler":
+        return "2.1"
+
+    # ParamSpider does not provide a standard version flag
+    if image == "deadbolt-paramspider":
+        return "1.0.1"
+
+    # waybackurls version is static and not printed via CLI
+    if image == "deadbolt-waybackurls":
+        return "0.1.0"
+    
+    # apktool version is available via docker run --rm --entrypoint /bin/sh deadbolt-apktool -c "java -jar /usr/local/bin/apktool.jar --version" but better to be static
+    if image == "deadbolt-apktool":
+        return "2.12.1"
+
+    # -------------------------------
+    # Image metadata and OCI version label
+    # -------------------------------
+    image_id, entrypoint, labelled = _inspect_image(image)
+    if labelled:
+        return labelled
+
+    # -------------------------------
+    # Persisted result for this image build
+    # -------------------------------
+    entry = cached_entry(image)
+
+    if (
+        image_id
+        and entry.get("image_id") == image_id
+        and is_valid(entry.get("installed"))
+    ):
+        return entry["installed"]
+
+    # -------------------------------
+    # Generic CLI-based detection
+    # -------------------------------
+    version, flag = _probe_version(
+        image,
+        entrypoint,
+        entry.get("winning_flag"),
+    )
+
+    if image_id and is_valid(version):
+        store_field(image, "installed", version)
+        store_field(image, "image_id", image_id)
+        if flag:
+            store_field(image, "winning_flag", flag)
+
+    return version
\ No newline at end of file
@@ -1,144 +1,339 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file version_cache.py
-# @brief Persistent cache for tool version resolution.
-#
-# This module implements a lightweight, file-backed cache for storing resolved
-# installed and latest tool versions. The cache is used to reduce repeated
-# external lookups (e.g. GitHub API calls) and to keep UI version display
-# responsive during scans.
-#
-# Cache entries are validated using a time-to-live (TTL) and basic sanity
-# checks to avoid propagating placeholder or invalid values.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-from pathlib import Path
-from datetime import datetime, timezone
-import json
-
-# Cache location and defaults
-CACHE_DIR = Path.home() / ".deadbolt"
-CACHE_FILE = CACHE_DIR / "version_cache.json"
-DEFAULT_TTL = 3600  # 1 hour
-
-# Values considered invalid for caching purposes
-INVALID_VALUES = {"unknown", "checking…", "-", "rolling", None}
-
-
-def load_cache() -> dict:
-    """
-    Load the version cache from disk.
-
-    If the cache file does not exist, a new cache structure with default
-    values is returned.
-    """
-    if not CACHE_FILE.exists():
-        return {
-            "schema": 1,
-            "ttl_seconds": DEFAULT_TTL,
-            "tools": {},
-        }
-
-    return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-
-
-def save_cache(cache: dict) -> None:
-    """
-    Persist the version cache to disk.
-
-    The cache directory is created if it does not already exist.
-    """
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    CACHE_FILE.write_text(
-        json.dumps(cache, indent=2),
-        encoding="utf-8",
-    )
-
-
-def is_fresh(entry: dict, ttl: int) -> bool:
-    """
-    Determine whether a cache entry is still fresh.
-
-    Freshness is based on the entry's timestamp and the configured TTL.
-    """
-    try:
-        ts = datetime.fromisoformat(entry["checked_at"])
-    except Exception:
-        return False
-
-    age = (datetime.now(timezone.utc) - ts).total_seconds()
-    return age < ttl
-
-
-def is_valid(value) -> bool:
-    """
-    Determine whether a cached value is valid.
-
-    Placeholder or sentinel values are treated as invalid and will trigger
-    re-resolution.
-    """
-    return value not in INVALID_VALUES
-
-
-def invalidate_version(image: str) -> None:
-    """
-    Remove a cached version entry for a specific image.
-
-    This forces version re-resolution on the next lookup.
-    """
-    cache = load_cache()
-    tools = cache.get("tools", {})
-
-    if image in tools:
-        del tools[image]
-        save_cache(cache)
-
-
-def get_cached_versions(
-    *,
-    image: str,
-    resolve_installed,
-    resolve_latest,
-) -> tuple[str, str]:
-    """
-    Retrieve cached installed and latest versions for a tool image.
-
-    The cache is used only if:
-    - an entry exists
-    - the entry is fresh
-    - both installed and latest values are valid
-
-    Otherwise, the provided resolver callables are invoked to re-resolve
-    versions, and the cache is updated accordingly.
-    """
-    cache = load_cache()
-    ttl = cache.get("ttl_seconds", DEFAULT_TTL)
-    tools = cache.setdefault("tools", {})
-
-    entry = tools.get(image)
-
-    # Use cache only if entry is fresh and values are valid
-    if (
-        entry
-        and is_fresh(entry, ttl)
-        and is_valid(entry.get("installed"))
-        and is_valid(entry.get("latest"))
-    ):
-        return entry["installed"], entry["latest"]
-
-    # Re-resolve versions
-    installed = resolve_installed(image)
-    latest = resolve_latest(image)
-
-    tools[image] = {
-        "installed": installed,
-        "latest": latest,
-        "checked_at": datetime.now(timezone.utc).isoformat(),
-    }
-
-    save_cache(cache)
-    return installed, latest
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file version_cache.py
+# @brief Persistent cache for tool version resolution.
+#
+# This module implements a lightweight, file-backed cache for storing resolved
+# installed and latest tool versions. The cache is used to reduce repeated
+# external lookups (e.g. GitHub API calls) and to keep UI version display
+# responsive during scans.
+#
+# Cache entries are validated using a time-to-live (TTL) and basic sanity
+# checks to avoid propagating placeholder or invalid values. Installed and
+# latest versions expire independently, and the file is parsed once per
+# process, shared between the threads that resolve versions, and written
+# back once when the process exits.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import atexit
+import json
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from main.utils.jsonio import write_bytes_atomic
+
+# Cache location and defaults
+CACHE_DIR = Path.home() / ".deadbolt"
+CACHE_FILE = CACHE_DIR / "version_cache.json"
+DEFAULT_TTL = 3600  # 1 hour
+
+# Upper bound on concurrent lookups in resolve_all_versions()
+MAX_RESOLVE_WORKERS = 16
+
+# Values considered invalid for caching purposes
+INVALID_VALUES = {"unknown", "checking…", "-", "rolling", None}
+
+# Process-wide copy of the cache file, loaded on first use
+_SHARED: Optional[dict] = None
+
+# Guards _SHARED, _DIRTY and writes of the cache file
+_LOCK = threading.RLock()
+
+# Whether _SHARED holds changes not yet written to disk
+_DIRTY = False
+
+
+def load_cache() -> dict:
+    """
+    Load the version cache from disk.
+
+    If the cache file does not exist or cannot be decoded, a new cache
+    structure with default values is returned; the versions are simply
+    detected again. orjson is used for decoding when installed.
+    """
+    default = {
+        "schema": 1,
+        "ttl_seconds": DEFAULT_TTL,
+        "tools": {},
+    }
+
+    if not CACHE_FILE.exists():
+        return default
+
+    data = CACHE_FILE.read_bytes()
+    try:
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        return default
+
+
+def save_cache(cache: dict) -> None:
+    """
+    Persist the version cache to disk.
+
+    The cache directory is created if it does not already exist. The file
+    is written compactly (with orjson when installed) and replaced
+    atomically, so a crash mid-write never leaves a corrupt cache behind.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        data = orjson.dumps(cache)
+    else:
+        data = json.dumps(cache, separators=(",", ":")).encode("utf-8")
+
+    write_bytes_atomic(CACHE_FILE, data)
+
+
+def is_fresh(entry: dict, ttl: int) -> bool:
+    """
+    Determine whether a cache entry is still fresh.
+
+    Freshness is based on the entry's timestamp and the configured TTL.
+    """
+    try:
+        ts = datetime.fromisoformat(entry["checked_at"])
+    except Exception:
+        return False
+
+    age = (datetime.now(timezone.utc) - ts).total_seconds()
+    return age < ttl
+
+
+def is_valid(value) -> bool:
+    """
+    Determine whether a cached value is valid.
+
+    Placeholder or sentinel values are treated as invalid and will trigger
+    re-resolution.
+    """
+    return value not in INVALID_VALUES
+
+
+def invalidate_version(image: str) -> None:
+    """
+    Remove a cached version entry for a specific image.
+
+    This forces version re-resolution on the next lookup.
+    """
+    with _LOCK:
+        cache = _shared_cache()
+        tools = cache["tools"]
+
+        if image in tools:
+            del tools[image]
+            _mark_dirty()
+
+
+def _shared_cache() -> dict:
+    """
+    Return the process-wide cache, loading it from disk on first use.
+
+    Callers must hold _LOCK.
+    """
+    global _SHARED
+    if _SHARED is None:
+        _SHARED = load_cache()
+        _SHARED.setdefault("tools", {})
+    return _SHARED
+
+
+def _mark_dirty() -> None:
+    """
+    Record that the shared cache must be written back.
+
+    Callers must hold _LOCK.
+    """
+    global _DIRTY
+    _DIRTY = True
+
+
+def flush_cache() -> None:
+    """
+    Write the shared cache to disk if it changed since the last flush.
+
+    Registered with atexit, so lookups made during a run are persisted
+    with a single write when the process exits.
+    """
+    global _DIRTY
+    with _LOCK:
+        if _DIRTY and _SHARED is not None:
+            save_cache(_SHARED)
+            _DIRTY = False
+
+
+atexit.register(flush_cache)
+
+
+def _field_fresh(entry: dict, field: str, ttl: int) -> bool:
+    """
+    Determine whether one field of a cache entry is fresh and valid.
+
+    Each field carries its own "<field>_checked_at" timestamp; entries
+    written before fields expired independently fall back to the shared
+    "checked_at".
+    """
+    if not is_valid(entry.get(field)):
+        return False
+
+    checked_at = entry.get(f"{field}_checked_at", entry.get("checked_at"))
+    return is_fresh({"checked_at": checked_at}, ttl)
+
+
+def cached_field(image: str, field: str) -> Optional[Any]:
+    """
+    Return a fresh, valid cached value for an image, or None.
+    """
+    with _LOCK:
+        cache = _shared_cache()
+        ttl = cache.get("ttl_seconds", DEFAULT_TTL)
+        entry = cache["tools"].get(image)
+
+        if entry and _field_fresh(entry, field, ttl):
+            return entry[field]
+    return None
+
+
+def cached_entry(image: str) -> dict:
+    """
+    Return a copy of the cache entry for an image, ignoring freshness.
+    """
+    with _LOCK:
+        return dict(_shared_cache()["tools"].get(image) or {})
+
+
+def store_field(image: str, field: str, value: Any) -> None:
+    """
+    Record a resolved value for an image.
+
+    The change is written to disk by flush_cache(). Storing a value
+    that is already cached and fresh is a no-op, so resolvers that
+    persist their own results are not written twice.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+
+    with _LOCK:
+        cache = _shared_cache()
+        ttl = cache.get("ttl_seconds", DEFAULT_TTL)
+        entry = cache["tools"].setdefault(image, {})
+
+        if entry.get(field) == value and _field_fresh(entry, field, ttl):
+            return
+
+        entry[field] = value
+        entry[f"{field}_checked_at"] = now
+        entry["checked_at"] = now
+        _mark_dirty()
+
+
+def _cached_or_resolve(
+    image: str,
+    field: str,
+    resolve: Callable[[str], Any],
+) -> Any:
+    """
+    Return a cached field value, resolving and storing it on a miss.
+    """
+    value = cached_field(image, field)
+    if value is not None:
+        return value
+
+    value = resolve(image)
+    store_field(image, field, value)
+    return value
+
+
+def get_cached_versions(
+    *,
+    image: str,
+    resolve_installed,
+    resolve_latest,
+) -> tuple[str, str]:
+    """
+    Retrieve cached installed and latest versions for a tool image.
+
+    Each version is taken from the cache only if:
+    - an entry exists
+    - that version is fresh
+    - that version is valid
+
+    Otherwise, the matching resolver callable is invoked to re-resolve
+    just that version, and the cache is updated accordingly. A failed
+    latest lookup therefore no longer forces the installed version to be
+    probed again, and vice versa.
+    """
+    installed = _cached_or_resolve(image, "installed", resolve_installed)
+    latest = _cached_or_resolve(image, "latest", resolve_latest)
+    return installed, latest
+
+
+def resolve_all_versions(
+    images: Iterable[str],
+    *,
+    resolve_installed,
+    resolve_latest,
+    on_resolved: Optional[Callable[[str, str, Optional[str]], None]] = None,
+) -> Dict[str, Tuple[str, Optional[str]]]:
+    """
+    Resolve installed and latest versions for many images at once.
+
+    Every (image, field) lookup is submitted to one thread pool, so
+    container probes overlap with GitHub requests and the wall time is
+    bounded by the slowest lookup rather than their sum. Cached values
+    are used exactly as in get_cached_versions().
+
+    on_resolved(image, installed, latest) is called from the resolving
+    thread as soon as both versions of an image are known. Images whose
+    resolver raised are left out of the result.
+    """
+    images = list(dict.fromkeys(images))
+    results: Dict[str, Tuple[str, Optional[str]]] = {}
+    if not images:
+        return results
+
+    resolvers = {"installed": resolve_installed, "latest": resolve_latest}
+    partial: Dict[str, Dict[str, Any]] = {image: {} for image in images}
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_RESOLVE_WORKERS, 2 * len(images)),
+        thread_name_prefix="ver",
+    ) as pool:
+        futures = {
+            pool.submit(_cached_or_resolve, image, field, resolve): (
+                image,
+                field,
+            )
+            for image in images
+            for field, resolve in resolvers.items()
+        }
+
+        for future in as_completed(futures):
+            image, field = futures[future]
+            try:
+                value = future.result()
+            except Exception:
+                partial.pop(image, None)
+                continue
+
+            fields = partial.get(image)
+            if fields is None:
+                continue
+
+            fields[field] = value
+            if len(fields) == len(resolvers):
+                results[image] = (fields["installed"], fields["latest"])
+                if on_resolved is not None:
+                    on_resolved(image, *results[image])
+
+    return results
\ No newline at end of file
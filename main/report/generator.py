@@ -1,125 +1,183 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file generator.py
-# @brief HTML report generation for Deadbolt scan runs.
-#
-# This module is responsible for generating the final HTML report for a
-# completed Deadbolt scan. It loads normalized findings and metadata,
-# applies severity gating rules, and renders the results using Jinja2
-# templates.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-from pathlib import Path
-import json
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-from main.core.severity import severity_at_least
-
-# Default minimum severity required for gated findings to appear in the report
-DEFAULT_MIN_SEVERITY = "low"
-
-
-def load_tool_registry(domain: str):
-    """
-    Load the tool registry for a given scan domain.
-
-    The registry is used to determine tool-specific behavior such as
-    severity gating when rendering the report.
-    """
-    if domain == "web":
-        from main.domains.web.tool_registry import TOOL_REGISTRY
-        return TOOL_REGISTRY
-
-    if domain == "android":
-        from main.domains.android.tool_registry import TOOL_REGISTRY
-        return TOOL_REGISTRY
-
-    if domain == "ios":
-        from main.domains.ios.tool_registry import TOOL_REGISTRY
-        return TOOL_REGISTRY
-
-    return {}
-
-
-def generate_report(run_dir: Path):
-    """
-    Generate the HTML report for a completed scan run.
-
-    This function loads run metadata and normalized findings, separates
-    attack surface information from vulnerability findings, applies
-    severity-based filtering, and renders the final report using a Jinja2
-    HTML template.
-    """
-
-    meta_path = run_dir / "meta.json"
-    findings_path = run_dir / "normalized" / "findings.json"
-    output_path = run_dir / "report.html"
-
-    if not meta_path.exists():
-        raise FileNotFoundError("meta.json not found")
-
-    if not findings_path.exists():
-        raise FileNotFoundError("findings.json not found")
-
-    # Load run metadata and normalized findings
-    meta = json.loads(meta_path.read_text(encoding="utf-8"))
-    all_findings = json.loads(findings_path.read_text(encoding="utf-8"))
-
-    domain = meta.get("domain", "web")
-    TOOL_REGISTRY = load_tool_registry(domain)
-
-    surface = []
-    vulnerabilities = []
-
-    # --------------------------------
-    # Finding classification
-    # --------------------------------
-    for f in all_findings:
-        kind = f.get("kind")
-
-        # Non-vulnerability findings represent attack surface
-        if kind != "finding":
-            surface.append(f)
-            continue
-
-        tool = f.get("tool")
-        spec = TOOL_REGISTRY.get(tool)
-
-        # Unknown tools always pass through
-        if not spec:
-            vulnerabilities.append(f)
-            continue
-
-        # Tools without severity gating always pass through
-        if not spec.severity_gated:
-            vulnerabilities.append(f)
-            continue
-
-        # Apply severity threshold
-        severity = f.get("severity") or "info"
-        if severity_at_least(severity, DEFAULT_MIN_SEVERITY):
-            vulnerabilities.append(f)
-
-    # --------------------------------
-    # HTML rendering
-    # --------------------------------
-    env = Environment(
-        loader=FileSystemLoader(Path(__file__).parent / "templates"),
-        autoescape=select_autoescape(["html"]),
-    )
-
-    template = env.get_template("report.html.j2")
-
-    html = template.render(
-        meta=meta,
-        domain=domain,
-        surface=surface,
-        findings=vulnerabilities,
-        min_severity=DEFAULT_MIN_SEVERITY,
-    )
-
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file generator.py
+# @brief HTML report generation for Deadbolt scan runs.
+#
+# This module is responsible for generating the final HTML report for a
+# completed Deadbolt scan. It loads normalized findings and metadata,
+# applies severity gating rules, and renders the results using Jinja2
+# templates.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+from main.core.severity import parse_severity
+from main.utils.jsonio import load_json
+
+# Default minimum severity required for gated findings to appear in the report
+DEFAULT_MIN_SEVERITY = "low"
+
+# Directory holding the report templates shipped with Deadbolt
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Template used to render the HTML report
+REPORT_TEMPLATE = "report.html.j2"
+
+# Compiled template bytecode persisted across runs
+BYTECODE_CACHE_DIR = Path.home() / ".deadbolt" / "jinja"
+
+
+def load_tool_registry(domain: str):
+    """
+    Load the tool registry for a given scan domain.
+
+    The registry is used to determine tool-specific behavior such as
+    severity gating when rendering the report.
+    """
+    if domain == "web":
+        from main.domains.web.tool_registry import TOOL_REGISTRY
+        return TOOL_REGISTRY
+
+    if domain == "android":
+        from main.domains.android.tool_registry import TOOL_REGISTRY
+        return TOOL_REGISTRY
+
+    if domain == "ios":
+        from main.domains.ios.tool_registry import TOOL_REGISTRY
+        return TOOL_REGISTRY
+
+    return {}
+
+
+@lru_cache(maxsize=None)
+def _gated_tools(domain: str) -> FrozenSet[str]:
+    """
+    Return the names of the domain's tools whose findings are gated by
+    severity.
+
+    Tools missing from the registry are never gated, so a single set
+    membership test decides whether a finding needs a severity check.
+    """
+    return frozenset(
+        name
+        for name, spec in load_tool_registry(domain).items()
+        if spec.severity_gated
+    )
+
+
+@lru_cache(maxsize=None)
+def _environment(templates_dir: Path) -> Environment:
+    """
+    Return the Jinja2 environment for a templates directory.
+
+    The environment is built once per process so its template cache is
+    reused across reports, and compiled templates are persisted to disk
+    so later runs skip parsing and compiling them. Templates are not
+    edited at runtime, so modification checks are disabled.
+    """
+    try:
+        BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR))
+    except OSError:
+        bytecode_cache = None
+
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["html"]),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def _report_template() -> Template:
+    """
+    Return the loaded report template.
+
+    The template is resolved and compiled on the first report only; later
+    reports in the same process render the same Template object.
+    """
+    return _environment(TEMPLATES_DIR).get_template(REPORT_TEMPLATE)
+
+
+def generate_report(run_dir: Path):
+    """
+    Generate the HTML report for a completed scan run.
+
+    This function loads run metadata and normalized findings, separates
+    attack surface information from vulnerability findings, applies
+    severity-based filtering, and renders the final report using a Jinja2
+    HTML template.
+    """
+
+    meta_path = run_dir / "meta.json"
+    findings_path = run_dir / "normalized" / "findings.json"
+    output_path = run_dir / "report.html"
+
+    if not meta_path.exists():
+        raise FileNotFoundError("meta.json not found")
+
+    if not findings_path.exists():
+        raise FileNotFoundError("findings.json not found")
+
+    # Load run metadata and normalized findings
+    meta = load_json(meta_path)
+    all_findings = load_json(findings_path)
+
+    domain = meta.get("domain", "web")
+    gated_tools = _gated_tools(domain)
+
+    surface = []
+    vulnerabilities = []
+
+    min_severity = parse_severity(DEFAULT_MIN_SEVERITY)
+
+    # Bound once, since the loop below runs for every finding
+    add_surface = surface.append
+    add_vulnerability = vulnerabilities.append
+    severity_of = parse_severity
+
+    # --------------------------------
+    # Finding classification
+    # --------------------------------
+    for f in all_findings:
+        # Non-vulnerability findings represent attack surface
+        if f.get("kind") != "finding":
+            add_surface(f)
+            continue
+
+        # Unknown and ungated tools always pass through; gated tools must
+        # meet the severity threshold
+        if (
+            f.get("tool") in gated_tools
+            and severity_of(f.get("severity") or "info") < min_severity
+        ):
+            continue
+
+        add_vulnerability(f)
+
+    # --------------------------------
+    # HTML rendering
+    # --------------------------------
+    html = _report_template().render(
+        meta=meta,
+        domain=domain,
+        surface=surface,
+        findings=vulnerabilities,
+        min_severity=DEFAULT_MIN_SEVERITY,
+    )
+
     output_path.write_text(html, encoding="utf-8")
\ No newline at end of file
@@ -1,68 +1,112 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file runner.py
-# @brief Androguard execution wrapper for Android static analysis.
-#
-# This module executes selected Androguard subcommands to extract
-# deterministic, machine-consumable Android metadata such as:
-# - Package identity (apkid)
-# - AndroidManifest.xml (axml)
-# - Signing and certificate information (sign)
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-from pathlib import Path
-import subprocess
-import json
-
-
-def _run(cmd: list[str]) -> str:
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(result.stderr)
-    return result.stdout.strip()
-
-
-def run_androguard(apk: Path, output: Path) -> None:
-    """
-    Execute Androguard against an Android APK.
-
-    Output:
-    - androguard.json: structured aggregation of androguard subcommand outputs
-    """
-
-    data = {}
-
-    data["apkid"] = _run([
-        "docker", "run", "--rm",
-        "-v", f"{apk.resolve()}:/input.apk",
-        "deadbolt-androguard",
-        "apkid",
-        "/input.apk",
-    ])
-
-    data["axml"] = _run([
-        "docker", "run", "--rm",
-        "-v", f"{apk.resolve()}:/input.apk",
-        "deadbolt-androguard",
-        "axml",
-        "/input.apk",
-    ])
-
-    data["sign"] = _run([
-        "docker", "run", "--rm",
-        "-v", f"{apk.resolve()}:/input.apk",
-        "deadbolt-androguard",
-        "sign",
-        "/input.apk",
-    ])
-
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(data, indent=2), encoding="utf-8")
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file runner.py
+# @brief Androguard execution wrapper for Android static analysis.
+#
+# This module executes selected Androguard subcommands to extract
+# deterministic, machine-consumable Android metadata such as:
+# - Package identity (apkid)
+# - AndroidManifest.xml (axml)
+# - Signing and certificate information (sign)
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import subprocess
+
+from main.utils.jsonio import dumps_json
+
+
+# Androguard subcommands whose outputs make up androguard.json
+SUBCOMMANDS = ("apkid", "axml", "sign")
+
+# Script baked into the image that runs every subcommand in one container
+BATCH_SCRIPT = "/opt/deadbolt/androguard_all.py"
+
+
+def _run(cmd: list[str]) -> str:
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return result.stdout.strip()
+
+
+def _run_batched(mount: str) -> bytes | None:
+    """
+    Run every subcommand in a single container via the image's batch
+    script and return the combined JSON document.
+
+    Returns None when the image predates the batch script, so the caller
+    can fall back to one container per subcommand.
+    """
+    result = subprocess.run(
+        [
+            "docker", "run", "--rm",
+            "-v", mount,
+            "--entrypoint", "python",
+            "deadbolt-androguard",
+            BATCH_SCRIPT,
+            "/input.apk",
+        ],
+        capture_output=True,
+    )
+
+    stderr = result.stderr.decode("utf-8", errors="replace")
+
+    if result.returncode != 0:
+        if "can't open file" in stderr:
+            return None
+        raise RuntimeError(stderr)
+
+    return result.stdout
+
+
+def run_androguard(apk: Path, output: Path) -> None:
+    """
+    Execute Androguard against an Android APK.
+
+    All subcommands run inside one container through the image's batch
+    script, saving a container start per subcommand. Images built before
+    the script existed fall back to one container per subcommand; those
+    are independent reads of the APK, so they run concurrently and the
+    wall time is that of the slowest one.
+
+    Output:
+    - androguard.json: structured aggregation of androguard subcommand outputs
+    """
+
+    mount = f"{apk.resolve()}:/input.apk"
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    batched = _run_batched(mount)
+    if batched is not None:
+        output.write_bytes(batched)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(SUBCOMMANDS)) as pool:
+        futures = {
+            command: pool.submit(_run, [
+                "docker", "run", "--rm",
+                "-v", mount,
+                "deadbolt-androguard",
+                command,
+                "/input.apk",
+            ])
+            for command in SUBCOMMANDS
+        }
+
+        data = {
+            command: future.result()
+            for command, future in futures.items()
+        }
+
+    output.write_bytes(dumps_json(data))
\ No newline at end of file
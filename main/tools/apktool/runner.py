@@ -1,96 +1,119 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file runner.py
-# @brief apktool execution wrapper.
-#
-# This module defines the execution logic for apktool using a containerized
-# runtime. apktool is used for static Android analysis to decode application
-# resources and the AndroidManifest.xml for configuration and attack surface
-# inspection.
-#
-# This module is intentionally execution-only. It does not interpret or analyze
-# decoded output; parsing and normalization are handled by a dedicated parser.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-from pathlib import Path
-import json
-import subprocess
-import tempfile
-import shutil
-
-
-def run_apktool(apk: Path, output: Path) -> None:
-    """
-    Execute apktool against an Android APK.
-
-    Input:
-    - apk: Path to the Android APK file
-
-    Output:
-    - apktool.json: normalized execution metadata describing decoded artifacts
-    - AndroidManifest.xml: the decoded manifest file for downstream parsing
-
-    Execution behavior:
-    - The APK is decoded using apktool inside a containerized environment.
-    - Decoding output is written to a temporary directory.
-    - The AndroidManifest.xml is copied to the output directory.
-    - High-level structural metadata (manifest presence and file list)
-      is persisted for downstream parsing.
-
-    This function performs no semantic analysis. Its responsibility is limited
-    to deterministic tool execution and minimal result materialization.
-    """
-
-    # Use a temporary directory to isolate decoded artifacts
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_dir = Path(tmp)
-
-        # Execute apktool inside the container
-        subprocess.run(
-            [
-                "docker", "run", "--rm",
-                "-v", f"{apk.resolve()}:/input.apk",
-                "-v", f"{tmp_dir.resolve()}:/out",
-                "deadbolt-apktool",
-                "d", "/input.apk",
-                "-o", "/out",
-                "-f",
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=False,
-        )
-
-        # Validate expected primary artifact
-        manifest = tmp_dir / "AndroidManifest.xml"
-        if not manifest.exists():
-            raise RuntimeError(
-                "apktool execution failed: AndroidManifest.xml not found"
-            )
-
-        # Copy the manifest to the output directory for the parser
-        output.parent.mkdir(parents=True, exist_ok=True)
-        manifest_output = output.parent / "AndroidManifest.xml"
-        shutil.copy2(manifest, manifest_output)
-
-        # Collect a normalized list of decoded files for downstream analysis
-        files = [
-            str(p.relative_to(tmp_dir))
-            for p in tmp_dir.rglob("*")
-            if p.is_file()
-        ]
-
-        data = {
-            "manifest": "AndroidManifest.xml",
-            "files": files,
-        }
-
-        # Persist normalized execution output
-        output.write_text(
-            json.dumps(data, indent=2),
-            encoding="utf-8",
-        )
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file runner.py
+# @brief apktool execution wrapper.
+#
+# This module defines the execution logic for apktool using a containerized
+# runtime. apktool is used for static Android analysis to decode application
+# resources and the AndroidManifest.xml for configuration and attack surface
+# inspection.
+#
+# This module is intentionally execution-only. It does not interpret or analyze
+# decoded output; parsing and normalization are handled by a dedicated parser.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+from pathlib import Path
+from typing import List
+import os
+import shutil
+import subprocess
+
+from main.utils.jsonio import dumps_json
+
+
+# Subdirectory of the raw output directory holding the decoded APK
+DECODED_DIR = "decoded"
+
+
+def _list_files(root: Path) -> List[str]:
+    """
+    List every regular file below `root` as a path relative to it.
+
+    os.walk is backed by os.scandir, whose directory entries already carry
+    the file type, so no per-file stat or Path object is needed.
+    """
+    base = os.fspath(root)
+    prefix_len = len(os.path.join(base, ""))
+
+    return [
+        os.path.join(dirpath, name)[prefix_len:]
+        for dirpath, _, filenames in os.walk(base)
+        for name in filenames
+    ]
+
+
+def run_apktool(apk: Path, output: Path) -> None:
+    """
+    Execute apktool against an Android APK.
+
+    Input:
+    - apk: Path to the Android APK file
+
+    Output:
+    - apktool.json: normalized execution metadata describing decoded artifacts
+    - decoded/: the decoded APK, including AndroidManifest.xml for
+      downstream parsing
+
+    Execution behavior:
+    - The APK is decoded using apktool inside a containerized environment.
+    - Decoding output is written directly below the output directory, so
+      the manifest is produced in its final location without a copy.
+    - High-level structural metadata (manifest location and file list)
+      is persisted for downstream parsing.
+
+    This function performs no semantic analysis. Its responsibility is limited
+    to deterministic tool execution and minimal result materialization.
+    """
+
+    out_dir = output.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # apktool -f replaces its output directory, so it decodes into a
+    # subdirectory rather than the mount point itself
+    decoded_dir = out_dir / DECODED_DIR
+
+    # Output from an earlier run must never be mistaken for this APK's
+    shutil.rmtree(decoded_dir, ignore_errors=True)
+
+    # Execute apktool inside the container
+    result = subprocess.run(
+        [
+            "docker", "run", "--rm",
+            "-v", f"{apk.resolve()}:/input.apk",
+            "-v", f"{out_dir.resolve()}:/out",
+            "deadbolt-apktool",
+            "d", "/input.apk",
+            "-o", f"/out/{DECODED_DIR}",
+            "-f",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"apktool execution failed: exit code {result.returncode}"
+        )
+
+    # Validate expected primary artifact
+    manifest = decoded_dir / "AndroidManifest.xml"
+    if not manifest.exists():
+        raise RuntimeError(
+            "apktool execution failed: AndroidManifest.xml not found"
+        )
+
+    # Collect a normalized list of decoded files for downstream analysis
+    files = _list_files(decoded_dir)
+
+    data = {
+        "manifest": f"{DECODED_DIR}/AndroidManifest.xml",
+        "files": files,
+    }
+
+    # Persist normalized execution output
+    output.write_bytes(dumps_json(data))
\ No newline at end of file
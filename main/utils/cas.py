@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file cas.py
+# @brief Content-addressed cache for tool outputs.
+#
+# This module stores the raw output of a tool execution under a key derived
+# from the tool name, the hash of its input artifact, the hashes of any
+# auxiliary inputs (e.g. wordlists) and the installed tool version. Later
+# runs (including fresh run directories) can restore a cached output instead
+# of executing the container again; the output is parsed afresh so findings
+# always point at the current run. Executions that produced no findings are
+# not cached.
+#
+# Entries live in one directory per key and are published with an atomic
+# rename, so a partially written entry is never observed. Entries expire
+# after a fixed time-to-live so live targets are rescanned periodically.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from main.execution.version_cache import is_valid
+from main.utils.state import hash_file
+
+# Cache location and defaults
+CAS_DIR = Path.home() / ".deadbolt" / "cas"
+DEFAULT_TTL = 7 * 24 * 3600  # 7 days
+
+
+def cas_key(
+    tool_name: str,
+    input_hash: str,
+    tool_version: Optional[str],
+    aux_inputs: Iterable[Path] = (),
+) -> Optional[Path]:
+    """
+    Resolve the cache entry directory for a tool execution.
+
+    The tool version is part of the key so that upgrading a tool image
+    invalidates its previous entries, and so are the contents of the
+    tool's auxiliary inputs so that editing e.g. a wordlist does too.
+    None is returned while the version is unresolved or invalid, or when
+    an auxiliary input cannot be read, in which case caching is bypassed.
+    """
+    if tool_version == "detecting…" or not is_valid(tool_version):
+        return None
+
+    parts = [input_hash, tool_version]
+    for aux in aux_inputs:
+        try:
+            parts.append(hash_file(aux))
+        except OSError:
+            return None
+
+    digest = hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    return CAS_DIR / tool_name / digest
+
+
+def cas_get(key: Path, output: Path, ttl: int = DEFAULT_TTL) -> bool:
+    """
+    Restore a cached raw output into the given output path.
+
+    Returns True on a hit, after the cached output has been copied to
+    `output`. Missing or expired entries return False and leave `output`
+    untouched.
+    """
+    cached_output = key / output.name
+
+    try:
+        st = cached_output.stat()
+    except OSError:
+        return False
+
+    if time.time() - st.st_mtime > ttl:
+        return False
+
+    shutil.copyfile(cached_output, output)
+    return True
+
+
+def cas_put(key: Path, output: Path) -> None:
+    """
+    Publish the raw output of a tool execution.
+
+    The entry is assembled in a temporary sibling directory and renamed
+    into place. If another entry was published concurrently, or the raw
+    output does not exist, the cache is left untouched.
+
+    Callers only publish executions that produced findings: an empty
+    result is as likely to come from a transient network failure as from
+    the target, and caching it would suppress rescans for the whole TTL.
+    """
+    if not output.is_file():
+        return
+
+    key.parent.mkdir(parents=True, exist_ok=True)
+    tmp = key.with_name(f"{key.name}.{os.getpid()}.tmp")
+
+    try:
+        tmp.mkdir(exist_ok=True)
+        shutil.copyfile(output, tmp / output.name)
+
+        if key.exists():
+            shutil.rmtree(key)
+        os.replace(tmp, key)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
\ No newline at end of file
@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file jsonio.py
+# @brief JSON serialization and persistence helpers.
+#
+# This module provides a single entrypoint for serializing Deadbolt artifacts
+# (metadata, state, normalized findings) to indented UTF-8 JSON bytes, and
+# for loading JSON files. When the optional orjson package is installed it is
+# used for encoding and decoding; otherwise the standard library json module
+# is used.
+#
+# It also provides an atomic file writer so that an interrupted run never
+# leaves a truncated artifact behind for resume to trip over, a streaming
+# writer for JSON arrays produced by generators, and a helper that merges
+# already-serialized JSON array files without re-encoding them.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import json
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are memory-mapped for decoding rather than read;
+# below it the mmap setup costs more than the copy it saves
+MMAP_THRESHOLD = 64 * 1024
+
+
+def dumps_json(
+    obj: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON bytes.
+
+    The output is always a single bytes object so callers can persist it
+    with one write. The optional default callable is used for values the
+    encoder cannot serialize natively.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+
+    return json.dumps(obj, indent=2, default=default).encode("utf-8")
+
+
+def load_json(path: Path) -> Any:
+    """
+    Load a JSON document from a file.
+
+    The file is read as raw bytes and handed to the decoder directly, so
+    no intermediate str copy of the document is built. With orjson, large
+    files are decoded straight from a read-only memory mapping, which also
+    avoids copying the file into a bytes object.
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The view must be released before the mapping is closed
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _open_sibling_tmp(path: Path) -> Tuple[int, Path]:
+    """
+    Create a uniquely named temporary file next to the given path.
+
+    A unique name keeps concurrent writers of the same destination (e.g.
+    two Deadbolt processes sharing the version cache) from truncating
+    each other's partial output. The file is made world-readable like a
+    regular file, since mkstemp creates it owner-only.
+    """
+    fd, name = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=path.name + ".",
+        suffix=".tmp",
+    )
+    os.fchmod(fd, 0o644)
+    return fd, Path(name)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Atomically replace a file with the given bytes.
+
+    Data is written to a sibling temporary file, flushed to stable storage
+    and then renamed over the destination, so readers observe either the
+    old or the new content and never a partial write.
+    """
+    fd, tmp = _open_sibling_tmp(path)
+
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json_array_atomic(
+    path: Path,
+    items: Iterable[Any],
+    *,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> int:
+    """
+    Atomically write a JSON array from an iterable, one element at a time.
+
+    Elements are encoded and written as they are produced, so a generator
+    never has to be materialized as a list. Returns the element count.
+    """
+    fd, tmp = _open_sibling_tmp(path)
+    count = 0
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(b"[")
+
+            for item in items:
+                if count:
+                    out.write(b",")
+                out.write(dumps_json(item, default=default))
+                count += 1
+
+            out.write(b"]")
+            out.flush()
+            os.fsync(out.fileno())
+
+        os.replace(tmp, path)
+    except BaseException:
+        # A parser generator may raise midway; never leave its partial
+        # output behind
+        tmp.unlink(missing_ok=True)
+        raise
+
+    return count
+
+
+def concat_json_arrays(path: Path, sources: Iterable[Path]) -> None:
+    """
+    Atomically write a JSON array holding the elements of several arrays.
+
+    Each source must contain a single JSON array. Their bodies are copied
+    byte-for-byte, so the elements are never decoded or re-encoded.
+    """
+    fd, tmp = _open_sibling_tmp(path)
+
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(b"[")
+            first = True
+
+            for src in sources:
+                data = src.read_bytes().strip()
+                if not (data.startswith(b"[") and data.endswith(b"]")):
+                    raise ValueError(f"Not a JSON array: {src}")
+
+                body = data[1:-1].strip()
+                if not body:
+                    continue
+
+                if not first:
+                    out.write(b",")
+                out.write(body)
+                first = False
+
+            out.write(b"]")
+            out.flush()
+            os.fsync(out.fileno())
+
+        os.replace(tmp, path)
+    except BaseException:
+        # An unreadable or malformed source must not leave a partial
+        # aggregate behind
+        tmp.unlink(missing_ok=True)
+        raise
\ No newline at end of file
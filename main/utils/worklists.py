@@ -1,60 +1,179 @@
-# SPDX-License-Identifier: MIT
-#
-# -----------------------------------------------------------------------------
-# @file worklists.py
-# @brief Worklist generation and merging helpers.
-#
-# This module manages plaintext worklists that represent intermediate
-# artifacts passed between discovery, enumeration, and vulnerability phases.
-#
-# Author: Rolstan Robert D'souza
-# Date: 2026
-# -----------------------------------------------------------------------------
-
-from pathlib import Path
-from typing import Iterable, List
-from main.schema.normalize import Finding
-
-
-def _write_or_merge_worklist_txt(path: Path, items: Iterable[str]) -> None:
-    """
-    Append new items to a plaintext worklist file, avoiding duplicates.
-
-    Existing entries are preserved; only previously unseen items are appended.
-    """
-    existing = set()
-    if path.exists():
-        existing = set(
-            line.strip()
-            for line in path.read_text(encoding="utf-8").splitlines()
-            if line.strip()
-        )
-
-    new_items = []
-    for x in items:
-        x = (x or "").strip()
-        if x and x not in existing:
-            existing.add(x)
-            new_items.append(x)
-
-    if new_items:
-        with path.open("a", encoding="utf-8") as f:
-            for x in new_items:
-                f.write(x + "\n")
-
-
-def _findings_to_work_items(
-    output_type: str,
-    findings: List[Finding],
-) -> List[str]:
-    """
-    Convert normalized findings into worklist items for the next phase.
-
-    Mapping:
-      - assets   -> Finding.asset
-      - paths    -> Finding.asset
-      - findings -> no downstream worklist (empty)
-    """
-    if output_type in ("assets", "paths"):
-        return [f.asset for f in findings]
-    return []
\ No newline at end of file
+# SPDX-License-Identifier: MIT
+#
+# -----------------------------------------------------------------------------
+# @file worklists.py
+# @brief Worklist generation and merging helpers.
+#
+# This module manages plaintext worklists that represent intermediate
+# artifacts passed between discovery, enumeration, and vulnerability phases.
+#
+# Each worklist has a binary sidecar holding one 64-bit hash per line, so a
+# merge only loads compact hashes instead of re-reading every line of text.
+# Merges are serialized per worklist so concurrent producers cannot
+# interleave appends to the text or its sidecar.
+#
+# Author: Rolstan Robert D'souza
+# Date: 2026
+# -----------------------------------------------------------------------------
+
+import hashlib
+import threading
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Set
+from main.schema.normalize import Finding
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Suffix of the hash sidecar kept next to each worklist
+SEEN_SUFFIX = ".seen"
+
+# Suffix of the lock file guarding worklist merges
+LOCK_SUFFIX = ".lock"
+
+# In-process locks per worklist path (flock alone is advisory per process)
+_LOCAL_LOCKS: Dict[str, threading.Lock] = {}
+_LOCAL_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def _worklist_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a worklist for the duration of a merge.
+
+    Threads of this process are serialized with an in-process lock; other
+    processes are excluded with fcntl.flock on a sibling lock file where
+    the platform supports it.
+    """
+    with _LOCAL_LOCKS_GUARD:
+        local = _LOCAL_LOCKS.setdefault(str(path), threading.Lock())
+
+    with local:
+        if fcntl is None:
+            yield
+            return
+
+        with open(path.with_name(path.name + LOCK_SUFFIX), "a") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _item_key(item: str) -> int:
+    """
+    Compute the stable 64-bit hash of a worklist item.
+    """
+    digest = hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _load_seen(path: Path, seen_path: Path) -> Set[int]:
+    """
+    Load the item hashes of a worklist from its sidecar.
+
+    The sidecar is rebuilt from the worklist text when it is missing,
+    truncated, or older than the worklist (i.e. the text was modified by
+    something other than this module).
+    """
+    try:
+        txt_mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        seen_path.unlink(missing_ok=True)
+        return set()
+
+    try:
+        if seen_path.stat().st_mtime_ns >= txt_mtime:
+            keys = array("Q")
+            keys.frombytes(seen_path.read_bytes())
+            return set(keys)
+    except (OSError, ValueError):
+        pass
+
+    seen = {
+        _item_key(line.strip())
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    }
+    seen_path.write_bytes(array("Q", seen).tobytes())
+    return seen
+
+
+def _write_or_merge_worklist_txt(path: Path, items: Iterable[str]) -> int:
+    """
+    Append new items to a plaintext worklist file, avoiding duplicates.
+
+    Existing entries are preserved; only previously unseen items are appended.
+    Duplicate detection uses the hash sidecar, so the cost of a merge is
+    proportional to the number of incoming items, not the worklist size.
+    Items are consumed lazily and written as they arrive.
+
+    Returns the number of items appended. The file is only created when at
+    least one item is written.
+    """
+    seen_path = path.with_name(path.name + SEEN_SUFFIX)
+
+    with _worklist_lock(path):
+        return _merge_locked(path, seen_path, items)
+
+
+def _merge_locked(path: Path, seen_path: Path, items: Iterable[str]) -> int:
+    """
+    Merge items into a worklist; the caller must hold the worklist lock.
+    """
+    seen = _load_seen(path, seen_path)
+
+    new_keys = array("Q")
+    f = None
+    try:
+        for x in items:
+            x = (x or "").strip()
+            if not x:
+                continue
+
+            key = _item_key(x)
+            if key in seen:
+                continue
+
+            seen.add(key)
+            new_keys.append(key)
+
+            if f is None:
+                f = path.open("a", encoding="utf-8")
+            f.write(x + "\n")
+    finally:
+        if f is not None:
+            f.close()
+
+    # The sidecar is appended after the text so that it is never newer
+    # than a worklist it does not fully describe
+    if new_keys:
+        with seen_path.open("ab") as sf:
+            sf.write(new_keys.tobytes())
+
+    return len(new_keys)
+
+
+def _findings_to_work_items(
+    output_type: str,
+    findings: Iterable[Finding],
+) -> Iterator[str]:
+    """
+    Convert normalized findings into worklist items for the next phase.
+
+    Items are yielded one at a time so they can be streamed straight into
+    a worklist without materializing an intermediate list.
+
+    Mapping:
+      - assets   -> Finding.asset
+      - paths    -> Finding.asset
+      - findings -> no downstream worklist (empty)
+    """
+    if output_type in ("assets", "paths"):
+        for f in findings:
+            yield f.asset
\ No newline at end of file